@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from typing import Callable
+
+from PySide6.QtCore import QTimer
+
+
+class DeferredSave:
+    """Coalesce repeated save requests into one *save* call after *delay_ms*.
+
+    ``schedule()`` (re)starts the delay; ``flush()`` runs a pending save
+    immediately and is a no-op when nothing is pending.
+    """
+
+    def __init__(self, save: Callable[[], None], delay_ms: int = 500) -> None:
+        self._save = save
+        self._timer = QTimer()
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(delay_ms)
+        self._timer.timeout.connect(self._run)
+
+    def schedule(self) -> None:
+        self._timer.start()
+
+    def pending(self) -> bool:
+        return self._timer.isActive()
+
+    def flush(self) -> None:
+        if self._timer.isActive():
+            self._run()
+
+    def _run(self) -> None:
+        self._timer.stop()
+        self._save()
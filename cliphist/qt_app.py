@@ -13,6 +13,7 @@ from PySide6.QtCore import QObject, Signal
 from PySide6.QtGui import QAction, QIcon
 from PySide6.QtWidgets import QApplication, QMenu, QStyle, QSystemTrayIcon
 
+from .deferred_save import DeferredSave
 from .favorites import FavoritesStore
 from .hotkeys import HotkeySpec, parse_hotkey_sequence
 from .models import ClipboardItem
@@ -50,6 +51,8 @@ class ClipHistApp:
         self._store: SQLiteHistoryStore | None = None
         self.favorites = FavoritesStore()
         self.favorites.load()
+        # 收藏变更合并为一次延迟写盘：界面先刷新，连续上移/下移也只写一次 JSON
+        self._fav_saver = DeferredSave(self._save_favorites, delay_ms=500)
 
         self.hotkey_show_hint: str | None = None
         self.hotkey_pause_hint: str | None = None
@@ -195,34 +198,31 @@ class ClipHistApp:
 
     def _toggle_favorite(self, item: ClipboardItem) -> tuple[bool, str | None]:
         is_now_fav, _ = self.favorites.toggle(item)
-        try:
-            self.favorites.save()
-        except Exception:
-            log.exception("保存收藏失败")
+        self._fav_saver.schedule()
         if self.panel.isVisible():
             self.panel.set_favorites(self._get_favorites())
         return True, None
 
     def _remove_favorite(self, fav_id: str) -> tuple[bool, str | None]:
         self.favorites.remove_by_id(fav_id)
-        try:
-            self.favorites.save()
-        except Exception:
-            log.exception("保存收藏失败")
+        self._fav_saver.schedule()
         if self.panel.isVisible():
             self.panel.set_favorites(self._get_favorites())
         return True, None
 
     def _reorder_favorites(self, fav_ids_in_order: list[str]) -> tuple[bool, str | None]:
         self.favorites.set_order(fav_ids_in_order)
-        try:
-            self.favorites.save()
-        except Exception:
-            log.exception("保存收藏排序失败")
+        self._fav_saver.schedule()
         if self.panel.isVisible():
             self.panel.set_favorites(self._get_favorites())
         return True, None
 
+    def _save_favorites(self) -> None:
+        try:
+            self.favorites.save()
+        except Exception:
+            log.exception("保存收藏失败")
+
     def _enable_persistence(self, enabled: bool) -> None:
         if enabled and self._store is None:
             db_path = self.settings.db_path or default_db_path()
@@ -422,6 +422,7 @@ class ClipHistApp:
             self.listener.stop()
         except Exception:
             log.debug("停止监听器异常", exc_info=True)
+        self._fav_saver.flush()
         try:
             if self._store is not None:
                 self._store.close()
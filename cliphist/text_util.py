@@ -4,12 +4,15 @@ from __future__ import annotations
 import html as _html
 import re
 
-_RE_HTML_SCRIPT_STYLE = re.compile(
-    r"<(script|style)\b[^>]*>.*?</\1>", re.IGNORECASE | re.DOTALL
-)
+_RE_HTML_RAW_OPEN = re.compile(r"<(script|style)\b", re.IGNORECASE)
+_RE_HTML_RAW_CLOSE = {
+    "script": re.compile(r"</script>", re.IGNORECASE),
+    "style": re.compile(r"</style>", re.IGNORECASE),
+}
 _RE_HTML_TAG = re.compile(r"<[^>]+>")
-_RE_RTF_CTRL = re.compile(r"\\[a-zA-Z]+\d* ?|[{}]")
-_RE_WS = re.compile(r"\s+")
+# Runs of RTF control words, braces and whitespace collapse to one space.
+_RE_RTF_CTRL_WS = re.compile(r"(?:\\[a-zA-Z]+\d* ?|[{}]|\s)+")
+_RE_RTF_TEXT = re.compile(r"[^{}\\\r\n]+")
 _RTF_DESTINATIONS = {
     "annotation",
     "author",
@@ -44,45 +47,94 @@ _RTF_DESTINATIONS = {
     "xmlnstbl",
 }
 _RTF_DESTINATIONS = {w.lower() for w in _RTF_DESTINATIONS}
+_CF_HTML_HEADER_MAX = 4096
+
 
+def _cf_html_offset(raw: bytes, key: bytes) -> int | None:
+    i = raw.find(key, 0, _CF_HTML_HEADER_MAX)
+    if i == -1:
+        return None
+    i += len(key)
+    eol = raw.find(b"\n", i, _CF_HTML_HEADER_MAX)
+    return int(raw[i : eol if eol != -1 else _CF_HTML_HEADER_MAX])
 
-def extract_html_fragment(raw: bytes) -> str:
+
+def extract_html_fragment(raw: bytes, max_len: int | None = None) -> str:
     """Extract the HTML fragment from a CF_HTML (Windows 'HTML Format') blob.
 
+    The ASCII header is parsed on the raw bytes. With *max_len*, at most
+    ``max_len * 4`` bytes (the UTF-8 worst case) of the fragment are decoded.
     Returns the decoded fragment string, or ``""`` on failure.
     """
     try:
-        header = raw[:4096].decode("ascii", errors="ignore")
-        start_key = "StartFragment:"
-        end_key = "EndFragment:"
-        start_i = header.find(start_key)
-        end_i = header.find(end_key)
-        if start_i != -1 and end_i != -1:
-            start_line = header[start_i : header.find("\n", start_i)].strip()
-            end_line = header[end_i : header.find("\n", end_i)].strip()
-            start = int(start_line.split(":", 1)[1].strip())
-            end = int(end_line.split(":", 1)[1].strip())
-            if 0 <= start < end <= len(raw):
-                return raw[start:end].decode("utf-8", errors="ignore")
+        start = _cf_html_offset(raw, b"StartFragment:")
+        end = _cf_html_offset(raw, b"EndFragment:")
+        if start is not None and end is not None and 0 <= start < end <= len(raw):
+            if max_len is not None:
+                end = min(end, start + max_len * 4)
+            return raw[start:end].decode("utf-8", errors="ignore")
     except Exception:
         pass
     return ""
 
 
+def _strip_script_style(s: str) -> str:
+    """Replace ``<script>``/``<style>`` elements with a space in one linear pass.
+
+    Equivalent to ``<(script|style)\\b[^>]*>.*?</\\1>`` but without the lazy
+    DOTALL scan that goes quadratic on many unclosed openers.
+    """
+    out: list[str] = []
+    unclosed: set[str] = set()
+    i = pos = 0
+    while True:
+        m = _RE_HTML_RAW_OPEN.search(s, pos)
+        if m is None:
+            break
+        name = m.group(1).lower()
+        if name in unclosed:
+            pos = m.end()
+            continue
+        gt = s.find(">", m.end())
+        if gt == -1:
+            break
+        close = _RE_HTML_RAW_CLOSE[name].search(s, gt + 1)
+        if close is None:
+            unclosed.add(name)
+            pos = m.end()
+            continue
+        out.append(s[i : m.start()])
+        out.append(" ")
+        i = pos = close.end()
+    if not out:
+        return s
+    out.append(s[i:])
+    return "".join(out)
+
+
+def _strip_tags(s: str) -> str:
+    # Nothing after the last ">" can be a tag; leaving it out of the regex
+    # keeps failed "<..." attempts from rescanning to the end of the string.
+    gt = s.rfind(">")
+    if gt == -1:
+        return s
+    return _RE_HTML_TAG.sub(" ", s[: gt + 1]) + s[gt + 1 :]
+
+
 def html_to_plain_text(s: str, max_len: int = 400) -> str:
     """Convert an HTML string to plain text, stripping tags & scripts."""
     if not s:
         return ""
-    s = _RE_HTML_SCRIPT_STYLE.sub(" ", s)
-    s = _RE_HTML_TAG.sub(" ", s)
+    s = _strip_script_style(s)
+    s = _strip_tags(s)
     # Handle truncated HTML like "<ul style=..." where no closing ">" exists.
     lt = s.rfind("<")
     gt = s.rfind(">")
     if lt > gt:
         s = s[:lt]
     s = _html.unescape(s)
-    s = s.replace("\r\n", "\n").replace("\r", "\n")
-    s = _RE_WS.sub(" ", s).strip()
+    # split() with no argument collapses whitespace runs and strips in C.
+    s = " ".join(s.split())
     return s[:max_len]
 
 
@@ -153,10 +205,13 @@ def rtf_to_plain_text(raw: bytes, max_len: int = 400) -> str:
             continue
 
         if ch != "\\":
+            # Consume the whole run of literal text (or skipped pict/objdata
+            # hex) at once instead of one character per loop iteration.
             pending_ignorable = False
+            j = _RE_RTF_TEXT.match(s, i).end()
             if not skip_group:
-                out.append(ch)
-            i += 1
+                out.append(s[i:j])
+            i = j
             continue
 
         i += 1
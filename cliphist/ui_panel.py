@@ -1,20 +1,48 @@
 from __future__ import annotations
 
+import struct
+from bisect import bisect_right
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Callable
 
-from PySide6.QtCore import Qt, QMimeData, QTimer, QUrl, QRect, QPoint, QEvent
-from PySide6.QtGui import QColor, QCursor, QDrag, QGuiApplication, QImage, QPainter, QPainterPath, QPixmap
+from PySide6.QtCore import (
+    Qt,
+    QAbstractListModel,
+    QMimeData,
+    QModelIndex,
+    QObject,
+    QRunnable,
+    QThreadPool,
+    QTimer,
+    QUrl,
+    QRect,
+    QPoint,
+    QSize,
+    QEvent,
+    Signal,
+)
+from PySide6.QtGui import (
+    QColor,
+    QCursor,
+    QDrag,
+    QFont,
+    QFontMetrics,
+    QGuiApplication,
+    QImage,
+    QPainter,
+    QPainterPath,
+    QPixmap,
+    QPixmapCache,
+    QStaticText,
+)
 from PySide6.QtWidgets import (
     QApplication,
     QFrame,
-    QGraphicsDropShadowEffect,
     QHBoxLayout,
     QLabel,
     QLineEdit,
-    QListWidget,
-    QListWidgetItem,
+    QListView,
     QMenu,
     QSizeGrip,
     QStyle,
@@ -27,10 +55,10 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+from .favorites import item_fingerprint
 from .models import ClipboardItem
 from .text_util import (
-    _RE_RTF_CTRL,
-    _RE_WS,
+    _RE_RTF_CTRL_WS,
     extract_html_fragment,
     html_to_plain_text,
     rtf_to_plain_text,
@@ -41,14 +69,168 @@ ROLE_FAV_ID = int(Qt.UserRole + 1)
 ROLE_IS_FAVORITE = int(Qt.UserRole + 2)
 ROLE_TITLE = int(Qt.UserRole + 3)
 ROLE_SUBTITLE = int(Qt.UserRole + 4)
+# (item, fav_id, _RowModel) in one lookup for the delegate's paint().
+ROLE_PAYLOAD = int(Qt.UserRole + 5)
+
+# Above this many rows the search index is also kept as one joined string so
+# a query is located with C-level str.find instead of a per-row Python loop.
+_BLOB_SCAN_MIN_ITEMS = 2000
+_BLOB_SEP = "\0"
+# Tooltips are built on hover only; anything longer is unreadable anyway.
+_TOOLTIP_MAX_LEN = 2000
+# Image/HTML/RTF payloads at least this large are decoded for the preview on a
+# worker thread; smaller ones are quick enough to render inline.
+_ASYNC_PREVIEW_MIN_BYTES = 256 * 1024
+# Drop shadow behind the panel card: spread past the card edge (the root
+# layout margin), downward offset and peak alpha.
+_CARD_SHADOW_SPREAD = 10
+_CARD_SHADOW_OFFSET_Y = 6
+_CARD_SHADOW_ALPHA = 90
+_CARD_RADIUS = 14  # matches #card border-radius in _PANEL_QSS
+# BITMAPINFOHEADER: biSize, biWidth, biHeight, biPlanes, biBitCount,
+# biCompression, biSizeImage, biXPelsPerMeter, biYPelsPerMeter, biClrUsed,
+# biClrImportant.
+_DIB_HEADER = struct.Struct("<IiiHHIIiiII")
+_BMP_FILE_HEADER = struct.Struct("<2sIHHI")
+
+
+def _extra_runs(short: list, long: list) -> list[tuple[int, int]] | None:
+    """Return the inclusive index runs of *long* that are not in *short*.
+
+    Returns ``None`` unless *short* is a subsequence of *long* by identity.
+    """
+    runs: list[tuple[int, int]] = []
+    j = 0
+    n_short = len(short)
+    run_start = -1
+    for i, x in enumerate(long):
+        if j < n_short and x is short[j]:
+            if run_start != -1:
+                runs.append((run_start, i - 1))
+                run_start = -1
+            j += 1
+        elif run_start == -1:
+            run_start = i
+    if j != n_short:
+        return None
+    if run_start != -1:
+        runs.append((run_start, len(long) - 1))
+    return runs
+
+
+class _ClipListModel(QAbstractListModel):
+    """Flat list model; rows are stored column-wise.
+
+    ``set_items`` narrows/widens with row removals/insertions when the new rows
+    are a subset/superset of the current ones (typing or deleting in the search
+    box) and falls back to a model reset otherwise.
+    """
+
+    _MAX_INCREMENTAL_RUNS = 16
+
+    def __init__(self, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self._items: list[ClipboardItem] = []
+        self._fav_ids: list[str | None] = []
+        self._rows: list[_RowModel] = []
+
+    def set_items(
+        self,
+        items: list[ClipboardItem],
+        fav_ids: list[str | None],
+        rows: list[_RowModel],
+    ) -> None:
+        old = self._items
+        runs = None
+        if len(items) < len(old):
+            runs = _extra_runs(items, old)
+        elif len(items) > len(old):
+            runs = _extra_runs(old, items)
+        elif all(a is b for a, b in zip(items, old)):
+            runs = []
+        if runs is None or len(runs) > self._MAX_INCREMENTAL_RUNS:
+            self.beginResetModel()
+            self._items = items
+            self._fav_ids = fav_ids
+            self._rows = rows
+            self.endResetModel()
+            return
+
+        # Work on copies: the old lists may be shared with the caller.
+        self._items = old[:]
+        self._fav_ids = self._fav_ids[:]
+        self._rows = self._rows[:]
+        if len(items) < len(old):
+            for a, b in reversed(runs):
+                self.beginRemoveRows(QModelIndex(), a, b)
+                del self._items[a : b + 1]
+                del self._fav_ids[a : b + 1]
+                del self._rows[a : b + 1]
+                self.endRemoveRows()
+        else:
+            for a, b in runs:
+                self.beginInsertRows(QModelIndex(), a, b)
+                self._items[a:a] = items[a : b + 1]
+                self._fav_ids[a:a] = fav_ids[a : b + 1]
+                self._rows[a:a] = rows[a : b + 1]
+                self.endInsertRows()
+        changed = self._fav_ids != fav_ids or self._rows != rows
+        self._items = items
+        self._fav_ids = fav_ids
+        self._rows = rows
+        if changed and items:
+            self.dataChanged.emit(self.index(0, 0), self.index(len(items) - 1, 0))
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:  # type: ignore[override]
+        if parent.isValid():
+            return 0
+        return len(self._items)
+
+    def flags(self, index: QModelIndex):  # type: ignore[override]
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsDragEnabled
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):  # type: ignore[override]
+        row = index.row()
+        if not index.isValid() or row >= len(self._items):
+            return None
+        if role == ROLE_PAYLOAD:
+            return (self._items[row], self._fav_ids[row], self._rows[row])
+        if role == ROLE_ITEM:
+            return self._items[row]
+        if role == ROLE_TITLE:
+            return self._rows[row].title
+        if role == ROLE_SUBTITLE:
+            return self._rows[row].subtitle
+        if role == ROLE_IS_FAVORITE:
+            return self._fav_ids[row] is not None
+        if role == ROLE_FAV_ID:
+            return self._fav_ids[row]
+        if role == Qt.ToolTipRole:
+            return self._items[row].preview(_TOOLTIP_MAX_LEN)
+        return None
 
 
-class _ClipListWidget(QListWidget):
+class _ClipListView(QListView):
     def __init__(self, get_item: Callable[[int], ClipboardItem | None], parent: QWidget | None = None) -> None:
         super().__init__(parent)
         self._get_item = get_item
         self.setDragEnabled(True)
 
+    # QListWidget-style row helpers used throughout ClipPanel.
+    def count(self) -> int:
+        model = self.model()
+        return model.rowCount() if model is not None else 0
+
+    def currentRow(self) -> int:
+        return self.currentIndex().row()
+
+    def setCurrentRow(self, row: int) -> None:
+        model = self.model()
+        if model is not None:
+            self.setCurrentIndex(model.index(row, 0))
+
     def startDrag(self, supportedActions):  # type: ignore[override]
         row = self.currentRow()
         it = self._get_item(row)
@@ -56,6 +238,7 @@ class _ClipListWidget(QListWidget):
             return
 
         mime = QMimeData()
+        img: QImage | None = None
         if it.item_type in ("text", "html", "rtf"):
             mime.setText(it.text or "")
         elif it.item_type == "files":
@@ -70,10 +253,11 @@ class _ClipListWidget(QListWidget):
 
         drag = QDrag(self)
         drag.setMimeData(mime)
-        if it.item_type == "image":
-            img = _qimage_from_dib(it.raw_bytes or b"")
-            if img is not None and not img.isNull():
-                drag.setPixmap(QPixmap.fromImage(img).scaled(128, 128, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+        if img is not None and not img.isNull():
+            # Decoded once above; scale the QImage before converting so only the
+            # drag-cursor sized thumbnail becomes a pixmap. Fast scaling is
+            # indistinguishable at that size.
+            drag.setPixmap(QPixmap.fromImage(img.scaled(128, 128, Qt.KeepAspectRatio, Qt.FastTransformation)))
         # File drags should always behave like copy to avoid moving source files.
         if it.item_type == "files":
             drag.exec(Qt.CopyAction)
@@ -81,24 +265,73 @@ class _ClipListWidget(QListWidget):
             drag.exec(supportedActions)
 
 
+def _render_card_shadow(width: int, height: int) -> QPixmap:
+    """Return a soft shadow for a rounded card, padded by the spread on every side."""
+    spread = _CARD_SHADOW_SPREAD
+    pix = QPixmap(width + 2 * spread, height + 2 * spread)
+    pix.fill(Qt.transparent)
+    painter = QPainter(pix)
+    painter.setRenderHint(QPainter.Antialiasing)
+    painter.setPen(Qt.NoPen)
+    # Equally faint rounded rects shrinking towards the card edge; their
+    # overlap builds up the alpha, giving a falloff without a blur pass.
+    painter.setBrush(QColor(0, 0, 0, max(1, _CARD_SHADOW_ALPHA // spread)))
+    for i in range(spread):
+        radius = _CARD_RADIUS + spread - i
+        painter.drawRoundedRect(QRect(i, i, pix.width() - 2 * i, pix.height() - 2 * i), radius, radius)
+    painter.end()
+    return pix
+
+
+def _qimage_from_dib_pixels(
+    dib: bytes, header_size: int, width: int, height: int, bit_count: int, clr_used: int
+) -> QImage | None:
+    """Wrap uncompressed 24/32-bpp DIB pixels in a QImage without the BMP decoder."""
+    if bit_count == 32:
+        fmt = QImage.Format_RGB32  # B, G, R, x per pixel; BI_RGB alpha is undefined
+    elif bit_count == 24:
+        fmt = QImage.Format_BGR888
+    else:
+        return None
+    rows = abs(height)
+    if width <= 0 or rows == 0:
+        return None
+    bpl = (width * bit_count // 8 + 3) & ~3
+    offset = header_size + clr_used * 4
+    if offset + bpl * rows > len(dib):
+        return None
+    img = QImage(memoryview(dib)[offset:], width, rows, bpl, fmt)
+    # The QImage above borrows dib's buffer; both branches return an owning
+    # copy. A positive height means the rows are stored bottom-up.
+    return img.mirrored(False, True) if height > 0 else img.copy()
+
+
 def _qimage_from_dib(dib: bytes) -> QImage | None:
     if not dib:
         return None
-    import struct
-
     try:
-        header_size = struct.unpack_from("<I", dib, 0)[0]
+        header_size, width, height, _, bit_count, compression, _, _, _, clr_used, _ = _DIB_HEADER.unpack_from(dib)
         if header_size < 40:
             return None
-        bit_count = struct.unpack_from("<H", dib, 14)[0]
-        clr_used = struct.unpack_from("<I", dib, 32)[0]
+        if compression == 0:
+            img = _qimage_from_dib_pixels(dib, header_size, width, height, bit_count, clr_used)
+            if img is not None and not img.isNull():
+                return img
         if bit_count <= 8:
             palette_entries = clr_used or (1 << bit_count)
         else:
             palette_entries = 0
-        offset = 14 + header_size + palette_entries * 4
+        # A plain BITMAPINFOHEADER is followed by the colour masks for
+        # BI_BITFIELDS (3) / BI_ALPHABITFIELDS (6); V4/V5 headers embed them.
+        masks_size = 0
+        if header_size == 40:
+            if compression == 3:
+                masks_size = 12
+            elif compression == 6:
+                masks_size = 16
+        offset = 14 + header_size + masks_size + palette_entries * 4
         file_size = 14 + len(dib)
-        bf = b"BM" + struct.pack("<IHHI", file_size, 0, 0, offset)
+        bf = _BMP_FILE_HEADER.pack(b"BM", file_size, 0, 0, offset)
         bmp_bytes = bf + dib
         img = QImage.fromData(bmp_bytes, "BMP")
         if img is None or img.isNull():
@@ -112,11 +345,11 @@ def _html_fragment_from_clipboard(raw: bytes, max_len: int = 12000) -> str | Non
     """Extract the HTML fragment from raw CF_HTML bytes, truncated to *max_len*."""
     if not raw:
         return None
-    frag = extract_html_fragment(raw)
+    frag = extract_html_fragment(raw, max_len=max_len)
     if frag:
         return frag.strip()[:max_len]
     try:
-        s = raw.decode("utf-8", errors="ignore").strip()
+        s = raw[: max_len * 4].decode("utf-8", errors="ignore").strip()
         return s[:max_len]
     except Exception:
         return None
@@ -133,16 +366,111 @@ def _html_to_plain(s: str, max_len: int = 12000) -> str:
 def _clean_preview(item: ClipboardItem, max_len: int = 120) -> str:
     s = item.preview(10_000)
     if item.item_type == "html":
-        s = _html_to_plain(s, max_len=10_000)
+        # html_to_plain_text already collapses whitespace.
+        s = _html_to_plain(s, max_len=10_000).strip()
     elif item.item_type == "rtf":
-        s = _RE_RTF_CTRL.sub(" ", s)
-    s = s.replace("\r\n", "\n").replace("\r", "\n")
-    s = _RE_WS.sub(" ", s).strip()
+        s = _RE_RTF_CTRL_WS.sub(" ", s).strip()
+    elif not (s.isprintable() and "  " not in s and s[:1] != " " and s[-1:] != " "):
+        # isprintable() rules out every whitespace except " ", so a string
+        # passing the check above is already collapsed and stripped.
+        s = " ".join(s.split())
     return s if len(s) <= max_len else s[: max_len - 1] + "…"
 
 
-def _secondary_text(item: ClipboardItem) -> str:
-    ts = item.created_at.astimezone().strftime("%H:%M:%S")
+@dataclass(frozen=True, slots=True)
+class _RowModel:
+    title: str
+    subtitle: str
+    item_type: str
+    # Preview header ("TYPE · full local timestamp"), formatted with the row.
+    meta: str
+
+
+def _build_row(item: ClipboardItem) -> tuple[_RowModel, str]:
+    """Return the painted row and the lowercased search text for *item*.
+
+    The title and the search text share one ``_clean_preview`` pass.
+    """
+    full = _clean_preview(item, 10_000)
+    title = full if len(full) <= 150 else full[:149] + "…"
+    search = full.lower()
+    if item.item_type == "files" and item.file_paths:
+        search += "\n" + "\n".join(p.lower() for p in item.file_paths)
+    local = item.created_at.astimezone()
+    meta = f"{item.item_type.upper()} · {local.strftime('%Y-%m-%d %H:%M:%S')}"
+    row = _RowModel(title=title, subtitle=_secondary_text(item, local), item_type=item.item_type, meta=meta)
+    return row, search
+
+
+def _build_search_blob(index: list[str]) -> tuple[str, list[int]]:
+    starts: list[int] = []
+    pos = 0
+    for hay in index:
+        starts.append(pos)
+        pos += len(hay) + len(_BLOB_SEP)
+    return _BLOB_SEP.join(index), starts
+
+
+def _scan_search_blob(blob: str, starts: list[int], q: str) -> list[int]:
+    """Return the row indices whose search text contains *q* (which must not contain the separator)."""
+    rows: list[int] = []
+    n = len(starts)
+    pos = blob.find(q)
+    while pos != -1:
+        row = bisect_right(starts, pos) - 1
+        rows.append(row)
+        if row + 1 >= n:
+            break
+        pos = blob.find(q, starts[row + 1])
+    return rows
+
+
+def _compute_heavy_preview(item: ClipboardItem) -> QImage | str | None:
+    """Decode the preview of an image/HTML/RTF item; safe to call off the GUI thread."""
+    if item.item_type == "image":
+        return _qimage_from_dib(item.raw_bytes or b"")
+    if item.item_type == "html":
+        html = _html_fragment_from_clipboard(item.raw_bytes or b"")
+        return _html_to_plain(html or (item.text or ""), max_len=12000) or "(HTML 内容为空)"
+    if item.item_type == "rtf":
+        return _rtf_to_plain(item.raw_bytes or b"", max_len=12000) or (item.text or "")
+    return None
+
+
+class _PreviewSignals(QObject):
+    # (token, docked, item, result of _compute_heavy_preview)
+    ready = Signal(int, bool, object, object)
+
+
+class _PreviewTask(QRunnable):
+    def __init__(
+        self,
+        item: ClipboardItem,
+        token: int,
+        docked: bool,
+        is_current: Callable[[int, bool], bool],
+        signals: _PreviewSignals,
+    ) -> None:
+        super().__init__()
+        self._item = item
+        self._token = token
+        self._docked = docked
+        self._is_current = is_current
+        self._signals = signals
+
+    def run(self) -> None:
+        # Skip work for selections the user has already moved past.
+        if not self._is_current(self._token, self._docked):
+            return
+        try:
+            result = _compute_heavy_preview(self._item)
+        except Exception:
+            result = None
+        self._signals.ready.emit(self._token, self._docked, self._item, result)
+
+
+def _secondary_text(item: ClipboardItem, local: datetime) -> str:
+    ts = local.strftime("%H:%M:%S")
     if item.item_type == "files":
         n = len(item.file_paths or ())
         return f"{ts} · {n} 个文件"
@@ -158,13 +486,6 @@ def _secondary_text(item: ClipboardItem) -> str:
     return ts
 
 
-@dataclass(frozen=True, slots=True)
-class _RowModel:
-    title: str
-    subtitle: str
-    item_type: str
-
-
 class _ClipItemDelegate(QStyledItemDelegate):
     _TYPE_COLORS: dict[str, QColor] = {
         "text": QColor("#E0F2FE"),
@@ -181,69 +502,59 @@ class _ClipItemDelegate(QStyledItemDelegate):
         "html": "H",
         "rtf": "R",
     }
-
-    def __init__(self, parent: QWidget | None = None) -> None:
+    # Paint colours are immutable; build them once instead of per row per frame.
+    _BG = QColor("#FFFFFF")
+    _BG_SELECTED = QColor("#1D4ED8")
+    _BG_HOVER = QColor("#F1F5F9")
+    _FG = QColor("#0F172A")
+    _FG_SELECTED = QColor("#FFFFFF")
+    _SUB_FG = QColor("#64748B")
+    _SUB_FG_SELECTED = QColor(255, 255, 255, 220)
+    _SELECTED_ACCENT = QColor("#60A5FA")
+    _THUMB_BORDER = QColor(15, 23, 42, 40)
+    _BADGE_SELECTED_BG = QColor(255, 255, 255, 60)
+    _STAR = QColor("#F59E0B")
+    _SEPARATOR = QColor(148, 163, 184, 64)
+    _ROW_SIZE = QSize(0, 58)
+    _TEXT_CACHE_MAX = 4096
+
+    def __init__(self, parent: QObject | None = None) -> None:
         super().__init__(parent)
-        self._thumb_cache: dict[int, QPixmap] = {}
-        self._preview_cache: dict[int, str] = {}
-        self._secondary_cache: dict[int, str] = {}
-
-    def clear_caches(self) -> None:
-        """Clear text caches when items change."""
-        self._thumb_cache.clear()
-        self._preview_cache.clear()
-        self._secondary_cache.clear()
-
-    @staticmethod
-    def _cache_key(it: ClipboardItem) -> int:
-        # Avoid hashing large bytes payloads during paint (image/html/rtf items).
-        return id(it)
-
-    def _cached_preview(self, it: ClipboardItem, max_len: int = 150) -> str:
-        key = self._cache_key(it)
-        cached = self._preview_cache.get(key)
-        if cached is not None:
-            return cached
-        val = _clean_preview(it, max_len)
-        self._preview_cache[key] = val
-        if len(self._preview_cache) > 500:
-            self._preview_cache.pop(next(iter(self._preview_cache)))
-        return val
-
-    def _cached_secondary(self, it: ClipboardItem) -> str:
-        key = self._cache_key(it)
-        cached = self._secondary_cache.get(key)
-        if cached is not None:
-            return cached
-        val = _secondary_text(it)
-        self._secondary_cache[key] = val
-        if len(self._secondary_cache) > 500:
-            self._secondary_cache.pop(next(iter(self._secondary_cache)))
-        return val
+        # (text, width, bold) -> elided, pre-laid-out text for _text_font (or
+        # its bold variant). Hover and scroll repaint the same strings at the
+        # same width over and over.
+        self._text_cache: dict[tuple[str, int, bool], QStaticText] = {}
+        # None so the first paint() always derives the bold title font.
+        self._text_font: QFont | None = None
+        self._title_font = QFont()
+        self._title_fm = QFontMetrics(self._title_font)
 
     def paint(self, painter: QPainter, option, index):  # type: ignore[override]
-        it: ClipboardItem | None = index.data(ROLE_ITEM)
-        if it is None:
+        payload = index.data(ROLE_PAYLOAD)
+        if payload is None:
             super().paint(painter, option, index)
             return
 
-        is_fav = bool(index.data(ROLE_IS_FAVORITE))
+        it, fav_id, row = payload
+        is_fav = fav_id is not None
         painter.save()
         rect: QRect = option.rect
 
         is_selected = bool(option.state & QStyle.State_Selected)
         is_hover = bool(option.state & QStyle.State_MouseOver)
-        bg = QColor("#FFFFFF")
+        bg = self._BG
         if is_selected:
-            bg = QColor("#1D4ED8")
+            bg = self._BG_SELECTED
         elif is_hover:
-            bg = QColor("#F1F5F9")
-        fg = QColor("#0F172A") if not is_selected else QColor("#FFFFFF")
-        sub_fg = QColor("#64748B") if not is_selected else QColor(255, 255, 255, 220)
+            bg = self._BG_HOVER
+        fg = self._FG if not is_selected else self._FG_SELECTED
+        sub_fg = self._SUB_FG if not is_selected else self._SUB_FG_SELECTED
 
         painter.fillRect(rect, bg)
+        painter.setPen(self._SEPARATOR)
+        painter.drawLine(rect.bottomLeft(), rect.bottomRight())
         if is_selected:
-            painter.fillRect(QRect(rect.left(), rect.top(), 4, rect.height()), QColor("#60A5FA"))
+            painter.fillRect(QRect(rect.left(), rect.top(), 4, rect.height()), self._SELECTED_ACCENT)
 
         badge_size = 34
         left_pad = 12
@@ -261,7 +572,7 @@ class _ClipItemDelegate(QStyledItemDelegate):
                 painter.setClipPath(clip)
                 painter.drawPixmap(badge_rect, thumb)
                 painter.setClipping(False)
-                painter.setPen(QColor(15, 23, 42, 40))
+                painter.setPen(self._THUMB_BORDER)
                 painter.drawRoundedRect(badge_rect.adjusted(0, 0, -1, -1), 8, 8)
             else:
                 self._paint_icon_badge(painter, badge_rect, it, is_selected)
@@ -274,50 +585,64 @@ class _ClipItemDelegate(QStyledItemDelegate):
         y0 = rect.top() + 8
 
         fm1 = option.fontMetrics
-        title = str(index.data(ROLE_TITLE) or "")
-        if not title:
-            title = self._cached_preview(it, 150)
-        title = fm1.elidedText(title, Qt.ElideRight, w)
-
-        font_title = option.font
-        font_title.setBold(True)
-        painter.setFont(font_title)
+        font = option.font
+        if self._text_font is None or font != self._text_font:
+            self._text_font = QFont(font)
+            # Titles are bold; elide them with bold metrics, since drawStaticText
+            # does not clip to the text column.
+            self._title_font = QFont(font)
+            self._title_font.setBold(True)
+            self._title_fm = QFontMetrics(self._title_font)
+            self._text_cache.clear()
+        # Each line is centred in a fm.height() + 2 tall slot; drawStaticText
+        # takes the top-left corner, so the text starts 1 px into the slot.
+        line_h = fm1.height()
+
+        painter.setFont(self._title_font)
         painter.setPen(fg)
-        painter.drawText(QRect(x0, y0, w, fm1.height() + 2), Qt.AlignLeft | Qt.AlignVCenter, title)
+        painter.drawStaticText(x0, y0 + 1, self._static_text(self._title_fm, row.title, w, True))
 
-        subtitle = str(index.data(ROLE_SUBTITLE) or "")
-        if not subtitle:
-            subtitle = self._cached_secondary(it)
-        painter.setFont(option.font)
+        painter.setFont(font)
         painter.setPen(sub_fg)
-        painter.drawText(
-            QRect(x0, y0 + fm1.height() + 6, w, fm1.height() + 2),
-            Qt.AlignLeft | Qt.AlignVCenter,
-            fm1.elidedText(subtitle, Qt.ElideRight, w),
-        )
+        painter.drawStaticText(x0, y0 + line_h + 7, self._static_text(fm1, row.subtitle, w, False))
 
         if is_fav:
-            painter.setPen(QColor("#F59E0B") if not is_selected else QColor("#FFFFFF"))
+            painter.setPen(self._STAR if not is_selected else self._FG_SELECTED)
             painter.drawText(QRect(rect.right() - 28, rect.top(), 20, rect.height()), Qt.AlignCenter, "★")
 
         painter.restore()
 
+    def _static_text(self, fm, text: str, width: int, bold: bool) -> QStaticText:
+        key = (text, width, bold)
+        st = self._text_cache.get(key)
+        if st is None:
+            if len(self._text_cache) >= self._TEXT_CACHE_MAX:
+                self._text_cache.clear()
+            st = QStaticText(fm.elidedText(text, Qt.ElideRight, width))
+            st.setTextFormat(Qt.PlainText)
+            self._text_cache[key] = st
+        return st
+
     def sizeHint(self, option, index):  # type: ignore[override]
-        base = super().sizeHint(option, index)
-        return base.expandedTo(base.__class__(base.width(), 58))
-
-    def _image_thumb(self, it: ClipboardItem, size: int) -> QPixmap | None:
-        key = self._cache_key(it)
-        cached = self._thumb_cache.get(key)
-        if cached is not None:
-            return cached
-        img = _qimage_from_dib(it.raw_bytes or b"")
+        # Every row is painted into the same fixed height and the list views
+        # stretch rows to the viewport width, so there is nothing to measure.
+        return self._ROW_SIZE
+
+    @staticmethod
+    def _image_thumb(it: ClipboardItem, size: int) -> QPixmap | None:
+        # Shared by both lists through QPixmapCache (Qt-managed LRU) and keyed
+        # on content; bytes caches its own hash, so the key is cheap to rebuild.
+        raw = it.raw_bytes or b""
+        key = f"cliphist-thumb:{size}:{len(raw)}:{hash(raw)}"
+        pix = QPixmap()
+        if QPixmapCache.find(key, pix):
+            return pix
+        img = _qimage_from_dib(raw)
         if img is None or img.isNull():
             return None
-        pix = QPixmap.fromImage(img).scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-        self._thumb_cache[key] = pix
-        if len(self._thumb_cache) > 260:
-            self._thumb_cache.pop(next(iter(self._thumb_cache)))
+        # Scale the QImage first so only the thumbnail is converted to a pixmap.
+        pix = QPixmap.fromImage(img.scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+        QPixmapCache.insert(key, pix)
         return pix
 
     def _paint_icon_badge(
@@ -327,7 +652,7 @@ class _ClipItemDelegate(QStyledItemDelegate):
         it: ClipboardItem,
         is_selected: bool,
     ) -> None:
-        bg = QColor(255, 255, 255, 60) if is_selected else self._type_color(it.item_type)
+        bg = self._BADGE_SELECTED_BG if is_selected else self._type_color(it.item_type)
         painter.setBrush(bg)
         painter.setPen(Qt.NoPen)
         painter.drawEllipse(rect)
@@ -337,13 +662,169 @@ class _ClipItemDelegate(QStyledItemDelegate):
         font.setBold(True)
         font.setPointSize(max(8, font.pointSize() - 1))
         painter.setFont(font)
-        painter.setPen(QColor("#0F172A") if not is_selected else QColor("#FFFFFF"))
+        painter.setPen(self._FG if not is_selected else self._FG_SELECTED)
         painter.drawText(rect, Qt.AlignCenter, symbol)
 
     def _type_color(self, item_type: str) -> QColor:
         return self._TYPE_COLORS.get(item_type, self._DEFAULT_TYPE_COLOR)
 
 
+# Panel stylesheet; a module constant so each ClipPanel reuses the same string.
+_PANEL_QSS = """
+#card {
+  background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+                              stop:0 #F8FAFC, stop:1 #EEF2FF);
+  border: 1px solid rgba(148, 163, 184, 0.45);
+  border-radius: 14px;
+}
+QLabel#title {
+  font-size: 15px;
+  font-weight: 700;
+  color: #0F172A;
+}
+QLabel#status {
+  padding: 2px 10px;
+  border-radius: 10px;
+  background: rgba(15, 23, 42, 0.08);
+  color: #0F172A;
+}
+QLabel#status[paused="true"] {
+  background: rgba(239, 68, 68, 0.16);
+  color: #991B1B;
+}
+QLineEdit {
+  padding: 8px 12px;
+  border-radius: 10px;
+  border: 1px solid rgba(148, 163, 184, 0.6);
+  background: #FFFFFF;
+}
+QLineEdit:focus {
+  border: 1px solid #3B82F6;
+  background: #F8FAFC;
+}
+QListView {
+  border: 1px solid rgba(148, 163, 184, 0.5);
+  border-radius: 12px;
+  background: #FFFFFF;
+  outline: 0;
+}
+QTabWidget::pane {
+  border: 0;
+}
+QTabBar::tab {
+  padding: 6px 12px;
+  border-radius: 10px;
+  background: rgba(148, 163, 184, 0.18);
+  color: #334155;
+  margin-right: 6px;
+}
+QTabBar::tab:selected {
+  background: #2563EB;
+  color: #FFFFFF;
+}
+QListView::item:selected {
+  background: transparent;
+}
+QToolButton#btnIcon {
+  font-size: 15px;
+  padding: 0px;
+  border-radius: 8px;
+  border: 1px solid transparent;
+  background: transparent;
+  color: #475569;
+}
+QToolButton#btnIcon:hover {
+  background: rgba(148, 163, 184, 0.22);
+  border: 1px solid rgba(148, 163, 184, 0.35);
+  color: #0F172A;
+}
+QToolButton#btnIcon:checked {
+  background: rgba(59, 130, 246, 0.18);
+  border: 1px solid rgba(37, 99, 235, 0.45);
+  color: #1D4ED8;
+}
+#toolSep {
+  background: rgba(148, 163, 184, 0.35);
+}
+#previewCard {
+  border: 1px solid rgba(148, 163, 184, 0.45);
+  border-radius: 12px;
+  background: #FFFFFF;
+}
+#previewPopup {
+  border: 1px solid rgba(148, 163, 184, 0.6);
+  border-radius: 12px;
+  background: #FFFFFF;
+}
+QLabel#previewTitle {
+  font-weight: 600;
+  color: #0F172A;
+}
+QLabel#previewMeta {
+  color: #64748B;
+}
+QLabel#previewEmpty {
+  color: #94A3B8;
+}
+QTextBrowser#previewText {
+  background: transparent;
+  color: #0F172A;
+  border: 0;
+  padding: 2px 2px;
+}
+QLabel#previewImage {
+  background: #F8FAFC;
+  border-radius: 8px;
+}
+QToolButton#btnWinControl {
+  font-size: 14px;
+  font-weight: 700;
+  padding: 0px;
+  border-radius: 14px;
+  border: none;
+  background: transparent;
+  color: #64748B;
+}
+QToolButton#btnWinControl:hover {
+  background: rgba(148, 163, 184, 0.28);
+  color: #0F172A;
+}
+QToolButton#btnWinClose {
+  font-size: 14px;
+  font-weight: 700;
+  padding: 0px;
+  border-radius: 14px;
+  border: none;
+  background: transparent;
+  color: #64748B;
+}
+QToolButton#btnWinClose:hover {
+  background: rgba(239, 68, 68, 0.18);
+  color: #DC2626;
+}
+QScrollBar:vertical {
+  border: none;
+  background: transparent;
+  width: 6px;
+  margin: 4px 0;
+}
+QScrollBar::handle:vertical {
+  background: rgba(148, 163, 184, 0.45);
+  border-radius: 3px;
+  min-height: 30px;
+}
+QScrollBar::handle:vertical:hover {
+  background: rgba(100, 116, 139, 0.6);
+}
+QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
+  height: 0;
+}
+QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {
+  background: transparent;
+}
+"""
+
+
 class ClipPanel(QWidget):
     def __init__(
         self,
@@ -364,8 +845,23 @@ class ClipPanel(QWidget):
         self._remove_favorite = remove_favorite
         self._reorder_favorites = reorder_favorites
         self._all_items: list[ClipboardItem] = []
+        # Parallel to _all_items, so a filter pass only indexes lists.
+        self._search_index: list[str] = []
+        self._row_models: list[_RowModel] = []
+        # Favorite id per history row; None until the next filter pass after
+        # the items or the favorites change.
+        self._all_fav_ids: list[str | None] | None = None
+        # id(item) -> (item, row, search_text). The item is kept in the value
+        # so a recycled id() is detected; pruned on set_items/favorites.
+        self._row_cache: dict[int, tuple[ClipboardItem, _RowModel, str]] = {}
+        # id(item) -> (item, fingerprint); same lifetime rules as _row_cache.
+        self._fp_cache: dict[int, tuple[ClipboardItem, str]] = {}
+        self._search_blob: tuple[str, list[int]] | None = None
         self._filtered_items: list[ClipboardItem] = []
         self._favorites: list[tuple[str, ClipboardItem]] = []
+        self._fav_ids: frozenset[str] = frozenset()
+        self._fav_search_index: list[str] = []
+        self._fav_row_models: list[_RowModel] = []
         self._fav_filtered: list[tuple[str, ClipboardItem]] = []
         self._paused = False
         self._drag_pos: QPoint | None = None
@@ -376,11 +872,9 @@ class ClipPanel(QWidget):
 
         card = QFrame(self)
         card.setObjectName("card")
-        shadow = QGraphicsDropShadowEffect(card)
-        shadow.setBlurRadius(22)
-        shadow.setOffset(0, 6)
-        shadow.setColor(QColor(0, 0, 0, 90))
-        card.setGraphicsEffect(shadow)
+        self._card = card
+        # Painted by paintEvent; rebuilt only when the card changes size.
+        self._card_shadow: QPixmap | None = None
 
         self._search = QLineEdit(card)
         self._search.setPlaceholderText("搜索…")
@@ -390,41 +884,60 @@ class ClipPanel(QWidget):
         self._filter_timer.setSingleShot(True)
         self._filter_timer.setInterval(150)  # 150ms debounce
         self._filter_timer.timeout.connect(self._apply_filter)
+
+        self._smooth_rescale_timer = QTimer(self)
+        self._smooth_rescale_timer.setSingleShot(True)
+        self._smooth_rescale_timer.setInterval(150)
+        self._smooth_rescale_timer.timeout.connect(self._render_preview_image)
+        self._smooth_rescale_timer.timeout.connect(self._render_popup_image)
         self._search.textChanged.connect(lambda: self._filter_timer.start())
 
         self._tabs = QTabWidget(card)
         self._tabs.setObjectName("tabs")
 
-        self._list_all = _ClipListWidget(self._get_filtered_item, card)
+        self._list_all = _ClipListView(self._get_filtered_item, card)
+        self._model_all = _ClipListModel(self._list_all)
+        self._list_all.setModel(self._model_all)
         self._list_all.setUniformItemSizes(True)
         self._delegate_all = _ClipItemDelegate(self._list_all)
         self._list_all.setItemDelegate(self._delegate_all)
-        self._list_all.setVerticalScrollMode(QListWidget.ScrollPerPixel)
+        self._list_all.setVerticalScrollMode(QListView.ScrollPerPixel)
         self._list_all.verticalScrollBar().setSingleStep(18)
         self._list_all.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self._list_all.itemActivated.connect(lambda _: self._activate_current())
+        self._list_all.activated.connect(lambda _: self._activate_current())
         self._list_all.setMouseTracking(True)
-        self._list_all.currentItemChanged.connect(lambda *_: self._update_preview())
-        self._list_all.itemEntered.connect(lambda item: self._on_item_hover(self._list_all, item))
+        self._list_all.selectionModel().currentChanged.connect(lambda *_: self._update_preview())
+        self._list_all.entered.connect(lambda index: self._on_item_hover(self._list_all, index))
         self._list_all.setContextMenuPolicy(Qt.CustomContextMenu)
         self._list_all.customContextMenuRequested.connect(lambda pos: self._show_context_menu(self._list_all, pos))
         self._list_all.viewport().installEventFilter(self)
 
-        self._list_fav = _ClipListWidget(self._get_fav_filtered_item, card)
+        self._list_fav = _ClipListView(self._get_fav_filtered_item, card)
+        self._model_fav = _ClipListModel(self._list_fav)
+        self._list_fav.setModel(self._model_fav)
         self._list_fav.setUniformItemSizes(True)
         self._delegate_fav = _ClipItemDelegate(self._list_fav)
         self._list_fav.setItemDelegate(self._delegate_fav)
-        self._list_fav.setVerticalScrollMode(QListWidget.ScrollPerPixel)
+        self._list_fav.setVerticalScrollMode(QListView.ScrollPerPixel)
         self._list_fav.verticalScrollBar().setSingleStep(18)
         self._list_fav.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self._list_fav.itemActivated.connect(lambda _: self._activate_current())
+        self._list_fav.activated.connect(lambda _: self._activate_current())
         self._list_fav.setMouseTracking(True)
-        self._list_fav.currentItemChanged.connect(lambda *_: self._update_preview())
-        self._list_fav.itemEntered.connect(lambda item: self._on_item_hover(self._list_fav, item))
+        self._list_fav.selectionModel().currentChanged.connect(lambda *_: self._update_preview())
+        self._list_fav.entered.connect(lambda index: self._on_item_hover(self._list_fav, index))
         self._list_fav.setContextMenuPolicy(Qt.CustomContextMenu)
         self._list_fav.customContextMenuRequested.connect(lambda pos: self._show_context_menu(self._list_fav, pos))
         self._list_fav.viewport().installEventFilter(self)
 
+        # Context menus are built once and reused on every right-click.
+        self._menu_all = QMenu(self._list_all)
+        self._menu_all.addAction("收藏/取消收藏").triggered.connect(self._toggle_current_favorite)
+        self._menu_fav = QMenu(self._list_fav)
+        self._menu_fav.addAction("收藏/取消收藏").triggered.connect(self._toggle_current_favorite)
+        self._menu_fav.addAction("删除收藏").triggered.connect(self._remove_current_favorite)
+        self._menu_fav.addAction("上移").triggered.connect(lambda: self._move_favorite(-1))
+        self._menu_fav.addAction("下移").triggered.connect(lambda: self._move_favorite(1))
+
         tab_all = QWidget(card)
         tab_all_layout = QVBoxLayout(tab_all)
         tab_all_layout.setContentsMargins(0, 0, 0, 0)
@@ -479,7 +992,17 @@ class ClipPanel(QWidget):
         preview_body.addLayout(preview_header)
         preview_body.addWidget(self._preview_stack)
         self._preview.setLayout(preview_body)
-        self._preview_image: QImage | None = None
+        self._preview_pixmap: QPixmap | None = None
+        # Per target (docked=True / popup=False); bumped on every render so
+        # late results from the worker thread are discarded.
+        self._preview_generation: dict[bool, int] = {True: 0, False: 0}
+        self._preview_pool = QThreadPool(self)
+        self._preview_pool.setMaxThreadCount(1)
+        self._preview_signals = _PreviewSignals(self)
+        self._preview_signals.ready.connect(self._on_preview_ready)
+        # Item currently rendered in the docked preview / popup; a strong
+        # reference so identity checks can't be fooled by a recycled id().
+        self._preview_item: ClipboardItem | None = None
 
         self._preview_popup = QFrame(self, Qt.ToolTip | Qt.FramelessWindowHint)
         self._preview_popup.setObjectName("previewPopup")
@@ -515,7 +1038,8 @@ class ClipPanel(QWidget):
         popup_body.setSpacing(8)
         popup_body.addLayout(popup_header)
         popup_body.addWidget(self._popup_stack)
-        self._popup_image_data: QImage | None = None
+        self._popup_pixmap: QPixmap | None = None
+        self._popup_item: ClipboardItem | None = None
 
         # ── Row 1: Title bar ──
         title_bar = QHBoxLayout()
@@ -644,14 +1168,50 @@ class ClipPanel(QWidget):
 
     def set_items(self, items: list[ClipboardItem]) -> None:
         self._all_items = items
-        self._delegate_all.clear_caches()
+        self._prune_item_caches()
+        cached = [self._cached_row(it) for it in items]
+        self._row_models = [row for _, row, _ in cached]
+        self._search_index = [hay for _, _, hay in cached]
+        self._search_blob = None
+        self._all_fav_ids = None
         self._apply_filter()
 
     def set_favorites(self, favorites: list[tuple[str, ClipboardItem]]) -> None:
-        self._favorites = favorites
-        self._delegate_fav.clear_caches()
+        self._store_favorites(favorites)
         self._apply_filter()
 
+    def _store_favorites(self, favorites: list[tuple[str, ClipboardItem]]) -> None:
+        self._favorites = favorites
+        self._fav_ids = frozenset(fid for fid, _ in favorites)
+        self._prune_item_caches()
+        cached = [self._cached_row(it) for _, it in favorites]
+        self._fav_row_models = [row for _, row, _ in cached]
+        self._fav_search_index = [hay for _, _, hay in cached]
+        self._all_fav_ids = None
+
+    def _refresh_favorites(self) -> None:
+        if self._get_favorites is None:
+            return
+        try:
+            favorites = self._get_favorites()
+        except Exception:
+            return
+        self._store_favorites(favorites)
+
+    def _cached_row(self, it: ClipboardItem) -> tuple[ClipboardItem, _RowModel, str]:
+        entry = self._row_cache.get(id(it))
+        if entry is None or entry[0] is not it:
+            entry = (it, *_build_row(it))
+            self._row_cache[id(it)] = entry
+        return entry
+
+    def _prune_item_caches(self) -> None:
+        live = {id(it) for it in self._all_items}
+        live.update(id(it) for _, it in self._favorites)
+        for cache in (self._row_cache, self._fp_cache):
+            for key in [k for k in cache if k not in live]:
+                del cache[key]
+
     def toggle_visible(self) -> None:
         if self.isVisible():
             self.hide()
@@ -660,11 +1220,7 @@ class ClipPanel(QWidget):
 
     def _show_near_cursor(self) -> None:
         self._search.setText("")
-        if self._get_favorites is not None:
-            try:
-                self._favorites = self._get_favorites()
-            except Exception:
-                self._favorites = self._favorites
+        self._refresh_favorites()
         self._apply_filter()
 
         cursor_pos = QCursor.pos()
@@ -696,9 +1252,25 @@ class ClipPanel(QWidget):
             return
         super().keyPressEvent(event)
 
+    def paintEvent(self, event):  # type: ignore[override]
+        # Card shadow as a cached pixmap rather than a QGraphicsDropShadowEffect,
+        # which re-renders and blurs the whole card whenever anything in it
+        # repaints.
+        geo = self._card.geometry()
+        spread = _CARD_SHADOW_SPREAD
+        pix = self._card_shadow
+        if pix is None or pix.width() != geo.width() + 2 * spread or pix.height() != geo.height() + 2 * spread:
+            pix = self._card_shadow = _render_card_shadow(geo.width(), geo.height())
+        painter = QPainter(self)
+        painter.drawPixmap(geo.left() - spread, geo.top() - spread + _CARD_SHADOW_OFFSET_Y, pix)
+        painter.end()
+
     def resizeEvent(self, event):  # type: ignore[override]
         super().resizeEvent(event)
-        self._render_preview_image()
+        # Cheap scaling while the window is being dragged; one smooth pass once it settles.
+        self._render_preview_image(fast=True)
+        self._render_popup_image(fast=True)
+        self._smooth_rescale_timer.start()
         try:
             grip_size = self._grip.sizeHint()
             self._grip.move(
@@ -707,7 +1279,6 @@ class ClipPanel(QWidget):
             )
         except Exception:
             pass
-        self._render_popup_image()
 
     def mousePressEvent(self, event):  # type: ignore[override]
         if event.button() == Qt.LeftButton:
@@ -775,15 +1346,15 @@ class ClipPanel(QWidget):
     def _is_preview_list_viewport(self, obj) -> bool:
         return obj is self._list_all.viewport() or obj is self._list_fav.viewport()
 
-    def _hover_target_under_cursor(self) -> tuple[QListWidget, QListWidgetItem] | None:
+    def _hover_target_under_cursor(self) -> tuple[_ClipListView, QModelIndex] | None:
         pos = QCursor.pos()
         for widget in (self._list_all, self._list_fav):
             vp = widget.viewport()
             local = vp.mapFromGlobal(pos)
             if vp.rect().contains(local):
-                it = widget.itemAt(local)
-                if it is not None:
-                    return widget, it
+                index = widget.indexAt(local)
+                if index.isValid():
+                    return widget, index
         return None
 
     def _sync_hover_popup_from_cursor(self) -> None:
@@ -797,85 +1368,92 @@ class ClipPanel(QWidget):
         if target is None:
             self._hide_preview_popup()
             return
-        widget, item = target
-        self._on_item_hover(widget, item)
+        widget, index = target
+        self._on_item_hover(widget, index)
 
     def _apply_filter(self) -> None:
+        # A direct call supersedes any debounced run still pending from textChanged.
+        self._filter_timer.stop()
         q = (self._search.text() or "").strip().lower()
-        fav_ids = {fid for fid, _ in self._favorites}
-        preview_lc_cache: dict[int, str] = {}
-
-        def _preview_lc(it: ClipboardItem) -> str:
-            key = id(it)
-            cached = preview_lc_cache.get(key)
-            if cached is not None:
-                return cached
-            val = _clean_preview(it, 10_000).lower()
-            preview_lc_cache[key] = val
-            return val
-
-        def _matches_query(it: ClipboardItem) -> bool:
-            if q in _preview_lc(it):
-                return True
-            return it.item_type == "files" and any(q in p.lower() for p in (it.file_paths or ()))
+        # Every whitespace-separated term must match; the longest one is the
+        # most selective, so it narrows the candidates first.
+        terms = sorted(set(q.split()), key=len, reverse=True)
 
-        if not q:
-            self._filtered_items = self._all_items[:]
-            self._fav_filtered = self._favorites[:]
+        # Only the visible tab is rebuilt; switching tabs re-runs the filter
+        # through _on_tab_changed, so the hidden list is never shown stale.
+        if self._tabs.currentIndex() == 1:
+            self._filter_favorites(terms)
+            if self._fav_filtered:
+                self._list_fav.setCurrentRow(0)
         else:
-            self._filtered_items = [
-                it
-                for it in self._all_items
-                if _matches_query(it)
-            ]
-            self._fav_filtered = [
-                (fid, it)
-                for fid, it in self._favorites
-                if _matches_query(it)
-            ]
-
-        self._list_all.clear()
-        for it in self._filtered_items:
-            item = QListWidgetItem()
-            item.setData(ROLE_ITEM, it)
-            item.setData(ROLE_IS_FAVORITE, self._fav_id_for_item(it, fav_ids) is not None)
-            item.setData(ROLE_TITLE, _clean_preview(it, 150))
-            item.setData(ROLE_SUBTITLE, _secondary_text(it))
-            item.setToolTip(it.preview(10_000))
-            self._list_all.addItem(item)
-
-        self._list_fav.clear()
-        for fid, it in self._fav_filtered:
-            item = QListWidgetItem()
-            item.setData(ROLE_ITEM, it)
-            item.setData(ROLE_FAV_ID, fid)
-            item.setData(ROLE_IS_FAVORITE, True)
-            item.setData(ROLE_TITLE, _clean_preview(it, 150))
-            item.setData(ROLE_SUBTITLE, _secondary_text(it))
-            item.setToolTip(it.preview(10_000))
-            self._list_fav.addItem(item)
-
-        if self._tabs.currentIndex() == 0 and self._filtered_items:
-            self._list_all.setCurrentRow(0)
-        if self._tabs.currentIndex() == 1 and self._fav_filtered:
-            self._list_fav.setCurrentRow(0)
+            self._filter_history(terms)
+            if self._filtered_items:
+                self._list_all.setCurrentRow(0)
         self._sync_tooltips()
         self._update_preview()
 
+    def _filter_history(self, terms: list[str]) -> None:
+        if self._all_fav_ids is None:
+            fav_ids = self._fav_ids
+            self._all_fav_ids = [self._fav_id_for_item(it, fav_ids) for it in self._all_items]
+        all_fav_ids = self._all_fav_ids
+        row_models = self._row_models
+
+        if not terms:
+            self._filtered_items = self._all_items[:]
+            filtered_fav_ids = all_fav_ids
+            filtered_rows = row_models
+        else:
+            first, rest = terms[0], terms[1:]
+            all_items = self._all_items
+            index = self._search_index
+            if len(all_items) > _BLOB_SCAN_MIN_ITEMS and _BLOB_SEP not in first:
+                if self._search_blob is None:
+                    self._search_blob = _build_search_blob(index)
+                blob, starts = self._search_blob
+                rows = _scan_search_blob(blob, starts, first)
+            else:
+                rows = [i for i, hay in enumerate(index) if first in hay]
+            if rest:
+                rows = [i for i in rows if all(t in index[i] for t in rest)]
+            self._filtered_items = [all_items[i] for i in rows]
+            filtered_fav_ids = [all_fav_ids[i] for i in rows]
+            filtered_rows = [row_models[i] for i in rows]
+
+        self._model_all.set_items(self._filtered_items, filtered_fav_ids, filtered_rows)
+
+    def _filter_favorites(self, terms: list[str]) -> None:
+        fav_row_models = self._fav_row_models
+        if not terms:
+            self._fav_filtered = self._favorites[:]
+            fav_filtered_rows = fav_row_models
+        else:
+            favorites = self._favorites
+            rows = [i for i, hay in enumerate(self._fav_search_index) if all(t in hay for t in terms)]
+            self._fav_filtered = [favorites[i] for i in rows]
+            fav_filtered_rows = [fav_row_models[i] for i in rows]
+
+        self._model_fav.set_items(
+            [it for _, it in self._fav_filtered],
+            [fid for fid, _ in self._fav_filtered],
+            fav_filtered_rows,
+        )
+
     def _update_preview(self) -> None:
         it = self._item_at_current_row()
         if self._hover_preview:
             return
+        if it is not None and it is self._preview_item:
+            return
+        self._preview_item = it
         if it is None:
+            self._preview_generation[True] += 1
             self._preview_meta.setText("")
             self._preview_stack.setCurrentWidget(self._preview_empty)
-            self._preview_image = None
+            self._preview_pixmap = None
             self._preview_image_label.clear()
             return
 
-        ts = it.created_at.astimezone().strftime("%Y-%m-%d %H:%M:%S")
-        self._preview_meta.setText(f"{it.item_type.upper()} · {ts}")
-
         self._render_preview_content(
             it,
             self._preview_meta,
@@ -885,25 +1463,23 @@ class ClipPanel(QWidget):
             docked=True,
         )
 
-    def _render_preview_image(self) -> None:
-        if self._preview_image is None:
+    def _render_preview_image(self, fast: bool = False) -> None:
+        if self._preview_pixmap is None:
             return
         size = self._preview_stack.size()
         if size.width() <= 0 or size.height() <= 0:
             return
-        pix = QPixmap.fromImage(self._preview_image)
-        scaled = pix.scaled(size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-        self._preview_image_label.setPixmap(scaled)
+        mode = Qt.FastTransformation if fast else Qt.SmoothTransformation
+        self._preview_image_label.setPixmap(self._preview_pixmap.scaled(size, Qt.KeepAspectRatio, mode))
 
-    def _render_popup_image(self) -> None:
-        if self._popup_image_data is None:
+    def _render_popup_image(self, fast: bool = False) -> None:
+        if self._popup_pixmap is None:
             return
         size = self._popup_stack.size()
         if size.width() <= 0 or size.height() <= 0:
             return
-        pix = QPixmap.fromImage(self._popup_image_data)
-        scaled = pix.scaled(size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-        self._popup_image.setPixmap(scaled)
+        mode = Qt.FastTransformation if fast else Qt.SmoothTransformation
+        self._popup_image.setPixmap(self._popup_pixmap.scaled(size, Qt.KeepAspectRatio, mode))
 
     def _render_preview_content(
         self,
@@ -914,47 +1490,24 @@ class ClipPanel(QWidget):
         stack: QStackedWidget,
         docked: bool,
     ) -> None:
-        ts = it.created_at.astimezone().strftime("%Y-%m-%d %H:%M:%S")
-        meta_label.setText(f"{it.item_type.upper()} · {ts}")
+        meta_label.setText(self._cached_row(it)[1].meta)
 
-        if it.item_type == "image":
-            img = _qimage_from_dib(it.raw_bytes or b"")
-            if img is None or img.isNull():
-                text_widget.setPlainText("图片预览不可用")
-                stack.setCurrentWidget(text_widget)
-                if docked:
-                    self._preview_image = None
-                else:
-                    self._popup_image_data = None
-            else:
-                if docked:
-                    self._preview_image = img
-                    self._render_preview_image()
-                else:
-                    self._popup_image_data = img
-                    self._render_popup_image()
-                stack.setCurrentWidget(image_label)
-            return
+        self._preview_generation[docked] += 1
+        token = self._preview_generation[docked]
 
-        if docked:
-            self._preview_image = None
-            self._preview_image_label.clear()
-        else:
-            self._popup_image_data = None
-            self._popup_image.clear()
-
-        if it.item_type == "html":
-            html = _html_fragment_from_clipboard(it.raw_bytes or b"")
-            text = _html_to_plain(html or (it.text or ""), max_len=12000)
-            text_widget.setPlainText(text or "(HTML 内容为空)")
-            stack.setCurrentWidget(text_widget)
+        if it.item_type in ("image", "html", "rtf"):
+            if len(it.raw_bytes or b"") >= _ASYNC_PREVIEW_MIN_BYTES:
+                self._clear_preview_image(docked)
+                text_widget.setPlainText("加载中…")
+                stack.setCurrentWidget(text_widget)
+                self._preview_pool.start(
+                    _PreviewTask(it, token, docked, self._is_preview_current, self._preview_signals)
+                )
+                return
+            self._apply_heavy_preview(it, _compute_heavy_preview(it), docked)
             return
 
-        if it.item_type == "rtf":
-            text = _rtf_to_plain(it.raw_bytes or b"", max_len=12000) or (it.text or "")
-            text_widget.setPlainText(text)
-            stack.setCurrentWidget(text_widget)
-            return
+        self._clear_preview_image(docked)
 
         if it.item_type == "files":
             paths = it.file_paths or ()
@@ -971,30 +1524,85 @@ class ClipPanel(QWidget):
         text_widget.setPlainText(text)
         stack.setCurrentWidget(text_widget)
 
-    def _on_item_hover(self, widget: QListWidget, item: QListWidgetItem) -> None:
+    def _is_preview_current(self, token: int, docked: bool) -> bool:
+        return self._preview_generation[docked] == token
+
+    def _on_preview_ready(self, token: int, docked: bool, it: ClipboardItem, result: object) -> None:
+        if not self._is_preview_current(token, docked):
+            return
+        self._apply_heavy_preview(it, result, docked)
+
+    def _clear_preview_image(self, docked: bool) -> None:
+        if docked:
+            self._preview_pixmap = None
+            self._preview_image_label.clear()
+        else:
+            self._popup_pixmap = None
+            self._popup_image.clear()
+
+    def _apply_heavy_preview(self, it: ClipboardItem, result: object, docked: bool) -> None:
+        if docked:
+            text_widget, image_label, stack = self._preview_text, self._preview_image_label, self._preview_stack
+        else:
+            text_widget, image_label, stack = self._popup_text, self._popup_image, self._popup_stack
+
+        if it.item_type == "image":
+            img = result if isinstance(result, QImage) else None
+            if img is None or img.isNull():
+                text_widget.setPlainText("图片预览不可用")
+                stack.setCurrentWidget(text_widget)
+                if docked:
+                    self._preview_pixmap = None
+                else:
+                    self._popup_pixmap = None
+            else:
+                # Upload to a QPixmap once; resizes only rescale it.
+                if docked:
+                    self._preview_pixmap = QPixmap.fromImage(img)
+                    self._render_preview_image()
+                else:
+                    self._popup_pixmap = QPixmap.fromImage(img)
+                    self._render_popup_image()
+                stack.setCurrentWidget(image_label)
+            return
+
+        self._clear_preview_image(docked)
+        text_widget.setPlainText(result if isinstance(result, str) else "")
+        stack.setCurrentWidget(text_widget)
+
+    def _on_item_hover(self, widget: _ClipListView, index: QModelIndex) -> None:
         if not self._hover_preview:
             return
         if not (QApplication.keyboardModifiers() & Qt.ControlModifier):
             self._hide_preview_popup()
             return
-        it: ClipboardItem | None = item.data(ROLE_ITEM)
+        it: ClipboardItem | None = index.data(ROLE_ITEM)
         if it is None:
             return
         pos = QCursor.pos()
         self._show_preview_popup(it, pos)
 
     def _show_preview_popup(self, it: ClipboardItem, pos: QPoint) -> None:
-        self._render_preview_content(
-            it,
-            self._popup_meta,
-            self._popup_text,
-            self._popup_image,
-            self._popup_stack,
-            docked=False,
-        )
         popup_w = min(520, max(360, self.width() - 40))
         popup_h = 220 if it.item_type != "image" else 280
-        self._preview_popup.resize(popup_w, popup_h)
+        resized = self._preview_popup.size() != QSize(popup_w, popup_h)
+        if resized:
+            self._preview_popup.resize(popup_w, popup_h)
+            # Lay out now so the stack has its final size before an image is
+            # scaled into it; the popup may still be hidden at this point.
+            self._preview_popup.layout().activate()
+        if it is not self._popup_item:
+            self._render_preview_content(
+                it,
+                self._popup_meta,
+                self._popup_text,
+                self._popup_image,
+                self._popup_stack,
+                docked=False,
+            )
+            self._popup_item = it
+        elif resized:
+            self._render_popup_image()
         screen = QGuiApplication.screenAt(pos) or QGuiApplication.primaryScreen()
         screen_geo = screen.availableGeometry()
         x = min(max(pos.x() + 16, screen_geo.left()), screen_geo.right() - popup_w)
@@ -1036,7 +1644,7 @@ class ClipPanel(QWidget):
         self._on_activate(it)
         self.hide()
 
-    def _current_list(self) -> QListWidget:
+    def _current_list(self) -> _ClipListView:
         return self._list_fav if self._tabs.currentIndex() == 1 else self._list_all
 
     def _item_at_current_row(self) -> ClipboardItem | None:
@@ -1062,11 +1670,8 @@ class ClipPanel(QWidget):
         if it is None or self._toggle_favorite is None:
             return
         ok, _ = self._toggle_favorite(it)
-        if ok and self._get_favorites is not None:
-            try:
-                self._favorites = self._get_favorites()
-            except Exception:
-                pass
+        if ok:
+            self._refresh_favorites()
         self._apply_filter()
 
     def _remove_current_favorite(self) -> None:
@@ -1074,11 +1679,7 @@ class ClipPanel(QWidget):
         if fid is None or self._remove_favorite is None:
             return
         self._remove_favorite(fid)
-        if self._get_favorites is not None:
-            try:
-                self._favorites = self._get_favorites()
-            except Exception:
-                pass
+        self._refresh_favorites()
         self._apply_filter()
 
     def _move_favorite(self, delta: int) -> None:
@@ -1093,11 +1694,7 @@ class ClipPanel(QWidget):
         ids = [fid for fid, _ in self._fav_filtered]
         ids[row], ids[target] = ids[target], ids[row]
         self._reorder_favorites(ids)
-        if self._get_favorites is not None:
-            try:
-                self._favorites = self._get_favorites()
-            except Exception:
-                pass
+        self._refresh_favorites()
         self._apply_filter()
         self._tabs.setCurrentIndex(1)
         self._list_fav.setCurrentRow(target)
@@ -1106,46 +1703,34 @@ class ClipPanel(QWidget):
         self._sync_tooltips()
         self._apply_filter()
 
-    def _fav_id_for_item(self, it: ClipboardItem, fav_ids: set[str]) -> str | None:
-        fid = None
-        if it is None:
+    def _fav_id_for_item(self, it: ClipboardItem, fav_ids: frozenset[str]) -> str | None:
+        if it is None or not fav_ids:
             return None
-        try:
-            from .favorites import item_fingerprint
-
-            fid = item_fingerprint(it)
-        except Exception:
-            fid = None
+        entry = self._fp_cache.get(id(it))
+        if entry is None or entry[0] is not it:
+            try:
+                entry = (it, item_fingerprint(it))
+            except Exception:
+                return None
+            self._fp_cache[id(it)] = entry
+        fid = entry[1]
         return fid if fid in fav_ids else None
 
-    def _show_context_menu(self, widget: QListWidget, pos) -> None:
-        it = widget.itemAt(pos)
-        if it is None:
-            return
-        item_obj: ClipboardItem | None = it.data(ROLE_ITEM)
-        if item_obj is None:
+    def _show_context_menu(self, widget: _ClipListView, pos) -> None:
+        index = widget.indexAt(pos)
+        if not index.isValid():
             return
-        menu = QMenu(widget)
-        act_fav = menu.addAction("收藏/取消收藏")
-        act_del = None
-        act_up = None
-        act_down = None
-        if widget is self._list_fav:
-            act_del = menu.addAction("删除收藏")
-            act_up = menu.addAction("上移")
-            act_down = menu.addAction("下移")
-        chosen = menu.exec(widget.mapToGlobal(pos))
-        if chosen == act_fav:
-            self._toggle_current_favorite()
-        elif act_del is not None and chosen == act_del:
-            self._remove_current_favorite()
-        elif act_up is not None and chosen == act_up:
-            self._move_favorite(-1)
-        elif act_down is not None and chosen == act_down:
-            self._move_favorite(1)
+        # The menu actions work on the current row; make it the clicked one.
+        widget.setCurrentIndex(index)
+        menu = self._menu_fav if widget is self._list_fav else self._menu_all
+        menu.exec(widget.mapToGlobal(pos))
 
     def _sync_status(self) -> None:
         self._status.setText("暂停" if self._paused else "监听中")
+        # Re-polishing re-resolves the panel stylesheet for the label; only
+        # do it when the [paused] selector actually flips.
+        if self._status.property("paused") == self._paused:
+            return
         self._status.setProperty("paused", self._paused)
         self._status.style().unpolish(self._status)
         self._status.style().polish(self._status)
@@ -1167,161 +1752,4 @@ class ClipPanel(QWidget):
             return
 
     def _apply_styles(self) -> None:
-        self.setStyleSheet(
-            """
-            #card {
-              background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                                          stop:0 #F8FAFC, stop:1 #EEF2FF);
-              border: 1px solid rgba(148, 163, 184, 0.45);
-              border-radius: 14px;
-            }
-            QLabel#title {
-              font-size: 15px;
-              font-weight: 700;
-              color: #0F172A;
-            }
-            QLabel#status {
-              padding: 2px 10px;
-              border-radius: 10px;
-              background: rgba(15, 23, 42, 0.08);
-              color: #0F172A;
-            }
-            QLabel#status[paused="true"] {
-              background: rgba(239, 68, 68, 0.16);
-              color: #991B1B;
-            }
-            QLineEdit {
-              padding: 8px 12px;
-              border-radius: 10px;
-              border: 1px solid rgba(148, 163, 184, 0.6);
-              background: #FFFFFF;
-            }
-            QLineEdit:focus {
-              border: 1px solid #3B82F6;
-              background: #F8FAFC;
-            }
-            QListWidget {
-              border: 1px solid rgba(148, 163, 184, 0.5);
-              border-radius: 12px;
-              background: #FFFFFF;
-              outline: 0;
-            }
-            QTabWidget::pane {
-              border: 0;
-            }
-            QTabBar::tab {
-              padding: 6px 12px;
-              border-radius: 10px;
-              background: rgba(148, 163, 184, 0.18);
-              color: #334155;
-              margin-right: 6px;
-            }
-            QTabBar::tab:selected {
-              background: #2563EB;
-              color: #FFFFFF;
-            }
-            QListWidget::item {
-              border-bottom: 1px solid rgba(148, 163, 184, 0.25);
-            }
-            QListWidget::item:selected {
-              background: transparent;
-            }
-            QToolButton#btnIcon {
-              font-size: 15px;
-              padding: 0px;
-              border-radius: 8px;
-              border: 1px solid transparent;
-              background: transparent;
-              color: #475569;
-            }
-            QToolButton#btnIcon:hover {
-              background: rgba(148, 163, 184, 0.22);
-              border: 1px solid rgba(148, 163, 184, 0.35);
-              color: #0F172A;
-            }
-            QToolButton#btnIcon:checked {
-              background: rgba(59, 130, 246, 0.18);
-              border: 1px solid rgba(37, 99, 235, 0.45);
-              color: #1D4ED8;
-            }
-            #toolSep {
-              background: rgba(148, 163, 184, 0.35);
-            }
-            #previewCard {
-              border: 1px solid rgba(148, 163, 184, 0.45);
-              border-radius: 12px;
-              background: #FFFFFF;
-            }
-            #previewPopup {
-              border: 1px solid rgba(148, 163, 184, 0.6);
-              border-radius: 12px;
-              background: #FFFFFF;
-            }
-            QLabel#previewTitle {
-              font-weight: 600;
-              color: #0F172A;
-            }
-            QLabel#previewMeta {
-              color: #64748B;
-            }
-            QLabel#previewEmpty {
-              color: #94A3B8;
-            }
-            QTextBrowser#previewText {
-              background: transparent;
-              color: #0F172A;
-              border: 0;
-              padding: 2px 2px;
-            }
-            QLabel#previewImage {
-              background: #F8FAFC;
-              border-radius: 8px;
-            }
-            QToolButton#btnWinControl {
-              font-size: 14px;
-              font-weight: 700;
-              padding: 0px;
-              border-radius: 14px;
-              border: none;
-              background: transparent;
-              color: #64748B;
-            }
-            QToolButton#btnWinControl:hover {
-              background: rgba(148, 163, 184, 0.28);
-              color: #0F172A;
-            }
-            QToolButton#btnWinClose {
-              font-size: 14px;
-              font-weight: 700;
-              padding: 0px;
-              border-radius: 14px;
-              border: none;
-              background: transparent;
-              color: #64748B;
-            }
-            QToolButton#btnWinClose:hover {
-              background: rgba(239, 68, 68, 0.18);
-              color: #DC2626;
-            }
-            QScrollBar:vertical {
-              border: none;
-              background: transparent;
-              width: 6px;
-              margin: 4px 0;
-            }
-            QScrollBar::handle:vertical {
-              background: rgba(148, 163, 184, 0.45);
-              border-radius: 3px;
-              min-height: 30px;
-            }
-            QScrollBar::handle:vertical:hover {
-              background: rgba(100, 116, 139, 0.6);
-            }
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-              height: 0;
-            }
-            QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {
-              background: transparent;
-            }
-            """
-        )
+        self.setStyleSheet(_PANEL_QSS)
@@ -3,12 +3,12 @@ from __future__ import annotations
 import ctypes
 import logging
 import threading
+from ctypes import wintypes
 from dataclasses import dataclass
 from typing import Callable
 
 log = logging.getLogger(__name__)
 
-import pythoncom
 import win32con
 import win32gui
 
@@ -17,11 +17,52 @@ from .models import ClipboardItem
 
 
 user32 = ctypes.WinDLL("user32", use_last_error=True)
+# 原型只声明一次：调用时不再逐次推断参数类型，64 位下 HWND/LRESULT 也不会被截断为 int
+user32.SendMessageTimeoutW.argtypes = [
+    wintypes.HWND,
+    wintypes.UINT,
+    wintypes.WPARAM,
+    wintypes.LPARAM,
+    wintypes.UINT,
+    wintypes.UINT,
+    ctypes.POINTER(ctypes.c_size_t),
+]
+user32.SendMessageTimeoutW.restype = wintypes.LPARAM
+user32.RegisterHotKey.argtypes = [wintypes.HWND, ctypes.c_int, wintypes.UINT, wintypes.UINT]
+user32.RegisterHotKey.restype = wintypes.BOOL
+user32.UnregisterHotKey.argtypes = [wintypes.HWND, ctypes.c_int]
+user32.UnregisterHotKey.restype = wintypes.BOOL
+user32.AddClipboardFormatListener.argtypes = [wintypes.HWND]
+user32.AddClipboardFormatListener.restype = wintypes.BOOL
+user32.RemoveClipboardFormatListener.argtypes = [wintypes.HWND]
+user32.RemoveClipboardFormatListener.restype = wintypes.BOOL
+user32.SetTimer.argtypes = [wintypes.HWND, ctypes.c_size_t, wintypes.UINT, ctypes.c_void_p]
+user32.SetTimer.restype = ctypes.c_size_t
+user32.KillTimer.argtypes = [wintypes.HWND, ctypes.c_size_t]
+user32.KillTimer.restype = wintypes.BOOL
+user32.GetClipboardSequenceNumber.argtypes = []
+user32.GetClipboardSequenceNumber.restype = wintypes.DWORD
+user32.RegisterWindowMessageW.argtypes = [wintypes.LPCWSTR]
+user32.RegisterWindowMessageW.restype = wintypes.UINT
 
 
 WM_CLIPBOARDUPDATE = 0x031D
-WM_APP_REGISTER_HOTKEY = win32con.WM_APP + 1
-WM_APP_UNREGISTER_HOTKEY = win32con.WM_APP + 2
+# 系统分配的唯一消息号（0xC000–0xFFFF），不会与其他库使用的 WM_APP 偏移冲突
+WM_APP_REGISTER_HOTKEY = user32.RegisterWindowMessageW("ClipHist.RegisterHotkey")
+WM_APP_UNREGISTER_HOTKEY = user32.RegisterWindowMessageW("ClipHist.UnregisterHotkey")
+# 跨线程发送热键注册消息：SMTO_BLOCK 使调用方等待期间不处理其他线程发来的消息（避免重入），
+# SMTO_ABORTIFHUNG 与超时保证监听线程卡住时调用方不会无限阻塞
+SMTO_BLOCK = 0x0001
+SMTO_ABORTIFHUNG = 0x0002
+SEND_TIMEOUT_MS = 2000
+ERROR_TIMEOUT = 1460
+
+# 剪贴板更新去抖：同一窗口上重复 SetTimer 同一 ID 会重置计时，最后一次更新后才捕获
+CAPTURE_TIMER_ID = 1
+CAPTURE_DEBOUNCE_MS = 120
+
+# 仅消息窗口的父窗口：不参与 Z 序/EnumWindows，也收不到 WM_SETTINGCHANGE 等广播
+HWND_MESSAGE = -3
 
 
 @dataclass(frozen=True, slots=True)
@@ -39,9 +80,10 @@ class ClipboardListener:
         self._hwnd: int | None = None
         self._stop_event = threading.Event()
         self._ready_event = threading.Event()
-        self._timer_lock = threading.Lock()
-        self._capture_timer: threading.Timer | None = None
         self._hotkey_ids: set[int] = set()
+        # HotkeyEvent 不可变，按 id 复用同一实例；按住热键时 WM_HOTKEY 会按键盘重复频率到达
+        self._hotkey_events: dict[int, HotkeyEvent] = {}
+        self._last_seq = 0
 
     @property
     def hwnd(self) -> int | None:
@@ -77,24 +119,42 @@ class ClipboardListener:
         if not hwnd:
             return False, 0
         lparam = (int(modifiers) & 0xFFFF) | ((int(vk) & 0xFFFF) << 16)
-        err = int(user32.SendMessageW(hwnd, WM_APP_REGISTER_HOTKEY, int(hotkey_id), lparam))
-        return err == 0, err
+        ok, result = self._send_message(hwnd, WM_APP_REGISTER_HOTKEY, int(hotkey_id), lparam)
+        if not ok:
+            return False, result
+        return result == 0, result
 
     def unregister_hotkey(self, hotkey_id: int) -> None:
         hwnd = self._hwnd
         if not hwnd:
             return
         try:
-            user32.SendMessageW(hwnd, WM_APP_UNREGISTER_HOTKEY, int(hotkey_id), 0)
+            self._send_message(hwnd, WM_APP_UNREGISTER_HOTKEY, int(hotkey_id), 0)
         except Exception:
             pass
 
+    @staticmethod
+    def _send_message(hwnd: int, msg: int, wparam: int, lparam: int) -> tuple[bool, int]:
+        """Send *msg* to the listener window; returns (delivered, result or error code)."""
+        result = ctypes.c_size_t(0)
+        ctypes.set_last_error(0)
+        sent = user32.SendMessageTimeoutW(
+            hwnd,
+            msg,
+            wparam,
+            lparam,
+            SMTO_BLOCK | SMTO_ABORTIFHUNG,
+            SEND_TIMEOUT_MS,
+            ctypes.byref(result),
+        )
+        if not sent:
+            return False, int(ctypes.get_last_error()) or ERROR_TIMEOUT
+        return True, int(result.value)
+
     def _run(self) -> None:
-        pythoncom.CoInitialize()
-        try:
-            self._create_window_and_pump()
-        finally:
-            pythoncom.CoUninitialize()
+        # 捕获只用 Win32 剪贴板 API（OpenClipboard/GetClipboardData），不经过 OLE，
+        # 监听线程无需进入 COM 单线程单元
+        self._create_window_and_pump()
 
     def _create_window_and_pump(self) -> None:
         class_name = "ClipHistHiddenWindow"
@@ -118,7 +178,7 @@ class ClipboardListener:
             0,
             0,
             0,
-            0,
+            HWND_MESSAGE,
             0,
             wc.hInstance,
             None,
@@ -142,91 +202,120 @@ class ClipboardListener:
                 log.debug("DestroyWindow 异常", exc_info=True)
             self._hwnd = None
 
-    def _wnd_proc(self, hwnd: int, msg: int, wparam: int, lparam: int):
-        if msg == WM_APP_REGISTER_HOTKEY:
-            modifiers = int(lparam) & 0xFFFF
-            vk = (int(lparam) >> 16) & 0xFFFF
-            ctypes.set_last_error(0)
-            ok = bool(user32.RegisterHotKey(hwnd, int(wparam), int(modifiers), int(vk)))
-            if ok:
-                self._hotkey_ids.add(int(wparam))
-                return 0
-            err = int(ctypes.get_last_error())
-            return err or 1
-
-        if msg == WM_APP_UNREGISTER_HOTKEY:
-            try:
-                user32.UnregisterHotKey(hwnd, int(wparam))
-            except Exception:
-                log.debug("UnregisterHotKey 异常", exc_info=True)
-            self._hotkey_ids.discard(int(wparam))
+    def _on_register_hotkey(self, hwnd: int, wparam: int, lparam: int) -> int:
+        modifiers = int(lparam) & 0xFFFF
+        vk = (int(lparam) >> 16) & 0xFFFF
+        ctypes.set_last_error(0)
+        ok = bool(user32.RegisterHotKey(hwnd, int(wparam), int(modifiers), int(vk)))
+        if ok:
+            hotkey_id = int(wparam)
+            self._hotkey_ids.add(hotkey_id)
+            if hotkey_id not in self._hotkey_events:
+                self._hotkey_events[hotkey_id] = HotkeyEvent(hotkey_id=hotkey_id)
             return 0
+        err = int(ctypes.get_last_error())
+        return err or 1
 
-        if msg == WM_CLIPBOARDUPDATE:
-            self._schedule_capture()
-            return 0
-
-        if msg == win32con.WM_HOTKEY:
-            try:
-                self._on_event(HotkeyEvent(hotkey_id=int(wparam)))
-            except Exception:
-                log.debug("热键事件回调异常", exc_info=True)
-            return 0
+    def _on_unregister_hotkey(self, hwnd: int, wparam: int, lparam: int) -> int:
+        try:
+            user32.UnregisterHotKey(hwnd, int(wparam))
+        except Exception:
+            log.debug("UnregisterHotKey 异常", exc_info=True)
+        self._hotkey_ids.discard(int(wparam))
+        return 0
+
+    def _on_clipboard_update(self, hwnd: int, wparam: int, lparam: int) -> int:
+        self._schedule_capture()
+        return 0
+
+    def _on_timer(self, hwnd: int, wparam: int, lparam: int):
+        if int(wparam) != CAPTURE_TIMER_ID:
+            return win32gui.DefWindowProc(hwnd, win32con.WM_TIMER, wparam, lparam)
+        user32.KillTimer(hwnd, CAPTURE_TIMER_ID)
+        self._do_capture(hwnd)
+        return 0
+
+    def _on_hotkey(self, hwnd: int, wparam: int, lparam: int) -> int:
+        hotkey_id = int(wparam)
+        evt = self._hotkey_events.get(hotkey_id)
+        if evt is None:
+            evt = self._hotkey_events[hotkey_id] = HotkeyEvent(hotkey_id=hotkey_id)
+        try:
+            self._on_event(evt)
+        except Exception:
+            log.debug("热键事件回调异常", exc_info=True)
+        return 0
 
-        if msg == win32con.WM_CLOSE:
-            try:
-                win32gui.DestroyWindow(hwnd)
-            except Exception:
-                log.debug("WM_CLOSE DestroyWindow 异常", exc_info=True)
-            return 0
+    def _on_close(self, hwnd: int, wparam: int, lparam: int) -> int:
+        try:
+            win32gui.DestroyWindow(hwnd)
+        except Exception:
+            log.debug("WM_CLOSE DestroyWindow 异常", exc_info=True)
+        return 0
 
-        if msg == win32con.WM_DESTROY:
-            self._stop_event.set()
-            with self._timer_lock:
-                if self._capture_timer:
-                    try:
-                        self._capture_timer.cancel()
-                    except Exception:
-                        log.debug("取消定时器异常", exc_info=True)
-                    self._capture_timer = None
-            for hotkey_id in list(self._hotkey_ids):
-                try:
-                    user32.UnregisterHotKey(hwnd, hotkey_id)
-                except Exception:
-                    log.debug("WM_DESTROY UnregisterHotKey 异常", exc_info=True)
-            self._hotkey_ids.clear()
-            try:
-                user32.RemoveClipboardFormatListener(hwnd)
-            except Exception:
-                log.debug("WM_DESTROY RemoveClipboardFormatListener 异常", exc_info=True)
+    def _on_destroy(self, hwnd: int, wparam: int, lparam: int) -> int:
+        self._stop_event.set()
+        try:
+            user32.KillTimer(hwnd, CAPTURE_TIMER_ID)
+        except Exception:
+            log.debug("KillTimer 异常", exc_info=True)
+        for hotkey_id in list(self._hotkey_ids):
             try:
-                win32gui.PostQuitMessage(0)
+                user32.UnregisterHotKey(hwnd, hotkey_id)
             except Exception:
-                log.debug("PostQuitMessage 异常", exc_info=True)
-            return 0
-
-        return win32gui.DefWindowProc(hwnd, msg, wparam, lparam)
+                log.debug("WM_DESTROY UnregisterHotKey 异常", exc_info=True)
+        self._hotkey_ids.clear()
+        try:
+            user32.RemoveClipboardFormatListener(hwnd)
+        except Exception:
+            log.debug("WM_DESTROY RemoveClipboardFormatListener 异常", exc_info=True)
+        try:
+            win32gui.PostQuitMessage(0)
+        except Exception:
+            log.debug("PostQuitMessage 异常", exc_info=True)
+        return 0
+
+    _HANDLERS = {
+        WM_APP_REGISTER_HOTKEY: _on_register_hotkey,
+        WM_APP_UNREGISTER_HOTKEY: _on_unregister_hotkey,
+        WM_CLIPBOARDUPDATE: _on_clipboard_update,
+        win32con.WM_TIMER: _on_timer,
+        win32con.WM_HOTKEY: _on_hotkey,
+        win32con.WM_CLOSE: _on_close,
+        win32con.WM_DESTROY: _on_destroy,
+    }
+
+    def _wnd_proc(
+        self,
+        hwnd: int,
+        msg: int,
+        wparam: int,
+        lparam: int,
+        _get_handler=_HANDLERS.get,
+        _default_proc=win32gui.DefWindowProc,
+    ):
+        # 按消息号查表分发；分发表与 DefWindowProc 以默认参数绑定为局部变量，
+        # 每条消息都省去一次类属性/模块全局查找
+        handler = _get_handler(msg)
+        if handler is None:
+            return _default_proc(hwnd, msg, wparam, lparam)
+        return handler(self, hwnd, wparam, lparam)
 
     def _schedule_capture(self) -> None:
-        with self._timer_lock:
-            if self._capture_timer:
-                try:
-                    self._capture_timer.cancel()
-                except Exception:
-                    pass
-                self._capture_timer = None
-
-            timer = threading.Timer(0.12, self._do_capture)
-            timer.daemon = True
-            self._capture_timer = timer
-            timer.start()
-
-    def _do_capture(self) -> None:
+        # 在监听线程的窗口上计时（WM_TIMER），不再为每次更新新建线程
         hwnd = self._hwnd
-        if not hwnd or self._stop_event.is_set():
+        if hwnd:
+            user32.SetTimer(hwnd, CAPTURE_TIMER_ID, CAPTURE_DEBOUNCE_MS, None)
+
+    def _do_capture(self, hwnd: int) -> None:
+        # 只由监听窗口的 WM_TIMER 调用；WM_DESTROY 会先 KillTimer，无需再检查停止状态
+        # 同一次复制可能触发多条 WM_CLIPBOARDUPDATE；序列号未变说明内容已捕获过，无需再打开剪贴板
+        seq = int(user32.GetClipboardSequenceNumber())
+        if seq and seq == self._last_seq:
             return
         try:
             item = capture_clipboard(hwnd=hwnd)
+            self._last_seq = seq
             if item is not None:
                 self._on_event(item)
         except Exception:
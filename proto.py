@@ -1,4 +1,6 @@
-import time
+import threading
+
+import win32api
 
 from cliphist.store import ClipboardHistory
 from cliphist.win_listener import ClipboardListener, HotkeyEvent
@@ -18,12 +20,18 @@ def main() -> None:
     listener.start()
     print("Listening clipboard. Press Ctrl+C to exit.")
 
+    # 控制台处理函数由系统在独立线程中调用，主线程可无超时阻塞等待，空闲时不再每秒唤醒
+    stop = threading.Event()
+
+    def on_console_ctrl(ctrl_type: int) -> bool:
+        stop.set()
+        return True
+
+    win32api.SetConsoleCtrlHandler(on_console_ctrl, True)
     try:
-        while True:
-            time.sleep(1.0)
-    except KeyboardInterrupt:
-        pass
+        stop.wait()
     finally:
+        win32api.SetConsoleCtrlHandler(on_console_ctrl, False)
         listener.stop()
 
 
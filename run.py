@@ -3,32 +3,27 @@ import sys
 import ctypes
 import logging
 
-logging.basicConfig(
-    level=logging.WARNING,
-    format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
-    handlers=[
-        logging.StreamHandler(sys.stderr or open(os.devnull, "w")),
-    ],
-)
-
-
 _SINGLE_INSTANCE_MUTEX = "Local\\ClipHist.SingleInstance"
 _ERROR_ALREADY_EXISTS = 183
 _mutex_handle: int | None = None
 
+if os.name == "nt":
+    # kernel32 与函数原型只在导入时绑定一次，获取与释放互斥体共用
+    _kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    _kernel32.CreateMutexW.argtypes = [ctypes.c_void_p, ctypes.c_bool, ctypes.c_wchar_p]
+    _kernel32.CreateMutexW.restype = ctypes.c_void_p
+    _kernel32.CloseHandle.argtypes = [ctypes.c_void_p]
+    _kernel32.CloseHandle.restype = ctypes.c_int
+
 
 def _acquire_single_instance() -> bool:
     global _mutex_handle
     if os.name != "nt":
         return True
-    kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
-    create_mutex = kernel32.CreateMutexW
-    create_mutex.argtypes = [ctypes.c_void_p, ctypes.c_bool, ctypes.c_wchar_p]
-    create_mutex.restype = ctypes.c_void_p
-    handle = create_mutex(None, False, _SINGLE_INSTANCE_MUTEX)
+    handle = _kernel32.CreateMutexW(None, False, _SINGLE_INSTANCE_MUTEX)
     if not handle:
         return True
-    _mutex_handle = int(ctypes.cast(handle, ctypes.c_void_p).value or 0)
+    _mutex_handle = int(handle)
     return ctypes.get_last_error() != _ERROR_ALREADY_EXISTS
 
 
@@ -37,16 +32,23 @@ def _release_single_instance() -> None:
     if os.name != "nt" or not _mutex_handle:
         return
     try:
-        kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
-        close_handle = kernel32.CloseHandle
-        close_handle.argtypes = [ctypes.c_void_p]
-        close_handle.restype = ctypes.c_int
-        close_handle(ctypes.c_void_p(_mutex_handle))
+        _kernel32.CloseHandle(_mutex_handle)
     except Exception:
         pass
     _mutex_handle = None
 
 
+def _configure_logging() -> None:
+    # 取得单实例互斥体后才配置：重复启动直接退出的路径不再创建 handler。
+    # --windowed 打包模式下 sys.stderr 为 None，挂 NullHandler 丢弃日志，不再打开 os.devnull
+    handler: logging.Handler = logging.StreamHandler(sys.stderr) if sys.stderr is not None else logging.NullHandler()
+    logging.basicConfig(
+        level=logging.WARNING,
+        format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+        handlers=[handler],
+    )
+
+
 def _msgbox(text: str, title: str = "ClipHist") -> None:
     """在 --windowed 打包模式下 sys.stderr 为 None，使用 Win32 弹窗通知用户。"""
     try:
@@ -62,6 +64,9 @@ def _msgbox(text: str, title: str = "ClipHist") -> None:
 def _load_app():
     try:
         os.environ.setdefault("QT_LOGGING_RULES", "qt.qpa.window=false")
+        # 跳过 Qt 每次绘制时的不透明兄弟控件区域扣除。面板内唯一的重叠是卡片右下角的
+        # QSizeGrip；关闭扣除后仅该小块区域被卡片多画一次、随后被 grip 覆盖，结果不变
+        os.environ.setdefault("QT_NO_SUBTRACTOPAQUESIBLINGS", "1")
         from cliphist.qt_app import ClipHistApp
     except ModuleNotFoundError as e:
         missing = getattr(e, "name", "") or ""
@@ -81,6 +86,7 @@ def main() -> None:
         _msgbox("ClipHist 已在运行中。\n\n请查看系统托盘区域的 ClipHist 图标。")
         raise SystemExit(0)
 
+    _configure_logging()
     ClipHistApp = _load_app()
     try:
         app = ClipHistApp()
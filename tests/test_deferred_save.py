@@ -0,0 +1,69 @@
+import json
+
+import pytest
+
+pytest.importorskip("PySide6")
+
+from PySide6.QtCore import QEventLoop, QTimer
+
+from cliphist.deferred_save import DeferredSave
+from cliphist.favorites import FavoritesStore
+from cliphist.models import ClipboardItem
+
+
+@pytest.fixture(autouse=True)
+def _qapp(qapp):
+    return qapp
+
+
+def _run_event_loop_for(ms: int) -> None:
+    loop = QEventLoop()
+    QTimer.singleShot(ms, loop.quit)
+    loop.exec()
+
+
+def test_schedule_coalesces_into_one_save():
+    calls = []
+    saver = DeferredSave(lambda: calls.append(1), delay_ms=20)
+
+    for _ in range(3):
+        saver.schedule()
+    assert saver.pending()
+    assert calls == []
+
+    _run_event_loop_for(200)
+    assert calls == [1]
+    assert not saver.pending()
+
+
+def test_flush_runs_pending_save_once():
+    calls = []
+    saver = DeferredSave(lambda: calls.append(1), delay_ms=10_000)
+
+    saver.flush()
+    assert calls == []
+
+    saver.schedule()
+    saver.flush()
+    assert calls == [1]
+    assert not saver.pending()
+
+    saver.flush()
+    assert calls == [1]
+
+
+def test_flush_persists_toggled_favorite(tmp_path, monkeypatch):
+    monkeypatch.setenv("APPDATA", str(tmp_path))
+    store = FavoritesStore()
+    saver = DeferredSave(store.save, delay_ms=10_000)
+    item = ClipboardItem(created_at=ClipboardItem.now_utc(), item_type="text", text="hello")
+
+    store.toggle(item)
+    saver.schedule()
+    path = tmp_path / "ClipHist" / "favorites.json"
+    assert not path.exists()
+
+    saver.flush()
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    assert [row["item"]["text"] for row in data["favorites"]] == ["hello"]
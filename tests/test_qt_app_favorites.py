@@ -0,0 +1,60 @@
+import json
+
+import pytest
+
+pytest.importorskip("PySide6")
+pytest.importorskip("win32con")
+
+from cliphist import qt_app
+from cliphist.models import ClipboardItem
+
+
+class _FakeListener:
+    """Stands in for the Win32 listener so no window or global hotkey is created."""
+
+    def __init__(self, on_event) -> None:
+        self.on_event = on_event
+
+    def start(self) -> None:
+        pass
+
+    def stop(self, timeout_s: float = 2.0) -> None:
+        pass
+
+    def wait_ready(self, timeout_s: float = 2.0) -> bool:
+        return True
+
+    def register_hotkey_with_error(self, hotkey_id: int, modifiers: int, vk: int) -> tuple[bool, int]:
+        return True, 0
+
+    def unregister_hotkey(self, hotkey_id: int) -> None:
+        pass
+
+
+@pytest.fixture
+def app(qapp, tmp_path, monkeypatch):
+    monkeypatch.setenv("APPDATA", str(tmp_path))
+    monkeypatch.setattr(qt_app, "ClipboardListener", _FakeListener)
+    # QApplication is a per-process singleton; hand ClipHistApp the shared instance.
+    monkeypatch.setattr(qt_app, "QApplication", lambda argv: qapp)
+    return qt_app.ClipHistApp()
+
+
+def _saved_favorite_texts(tmp_path) -> list[str]:
+    with open(tmp_path / "ClipHist" / "favorites.json", encoding="utf-8") as f:
+        data = json.load(f)
+    return [row["item"]["text"] for row in data["favorites"]]
+
+
+def test_quit_flushes_pending_favorite_save(app, tmp_path):
+    item = ClipboardItem(created_at=ClipboardItem.now_utc(), item_type="text", text="hello")
+
+    app._toggle_favorite(item)
+    # The save is deferred; nothing is written until the timer fires or quit() flushes it.
+    assert app._fav_saver.pending()
+    assert not (tmp_path / "ClipHist" / "favorites.json").exists()
+
+    app.quit()
+
+    assert not app._fav_saver.pending()
+    assert _saved_favorite_texts(tmp_path) == ["hello"]
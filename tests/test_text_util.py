@@ -0,0 +1,154 @@
+import html
+import random
+import re
+
+import pytest
+
+from cliphist.text_util import (
+    _RE_RTF_CTRL_WS,
+    _strip_script_style,
+    _strip_tags,
+    extract_html_fragment,
+    html_to_plain_text,
+    rtf_to_plain_text,
+)
+
+# The regexes these helpers replaced; outputs must stay identical.
+_OLD_SCRIPT_STYLE = re.compile(r"<(script|style)\b[^>]*>.*?</\1>", re.IGNORECASE | re.DOTALL)
+_OLD_TAG = re.compile(r"<[^>]+>")
+_OLD_RTF_CTRL = re.compile(r"\\[a-zA-Z]+\d* ?|[{}]")
+_OLD_WS = re.compile(r"\s+")
+
+
+def _old_html_to_plain_text(s: str, max_len: int = 400) -> str:
+    if not s:
+        return ""
+    s = _OLD_SCRIPT_STYLE.sub(" ", s)
+    s = _OLD_TAG.sub(" ", s)
+    lt = s.rfind("<")
+    gt = s.rfind(">")
+    if lt > gt:
+        s = s[:lt]
+    s = html.unescape(s)
+    s = s.replace("\r\n", "\n").replace("\r", "\n")
+    s = _OLD_WS.sub(" ", s).strip()
+    return s[:max_len]
+
+
+def _old_extract_html_fragment(raw: bytes) -> str:
+    try:
+        header = raw[:4096].decode("ascii", errors="ignore")
+        start_i = header.find("StartFragment:")
+        end_i = header.find("EndFragment:")
+        if start_i != -1 and end_i != -1:
+            start_line = header[start_i : header.find("\n", start_i)].strip()
+            end_line = header[end_i : header.find("\n", end_i)].strip()
+            start = int(start_line.split(":", 1)[1].strip())
+            end = int(end_line.split(":", 1)[1].strip())
+            if 0 <= start < end <= len(raw):
+                return raw[start:end].decode("utf-8", errors="ignore")
+    except Exception:
+        pass
+    return ""
+
+
+_HTML_PIECES = [
+    "<script>", "</script>", "<SCRIPT type='x'>", "</Script>", "<style>", "</style>",
+    "<scripts>", "<p>", "</p>", "<br/>", "<", ">", "<a href='x'>", "&amp;", "&lt;", "&nbsp;",
+    "text", "more text", " ", "  ", "\n", "\r\n", "\t", "\x1c", "\u3000", "中文",
+]
+
+
+def _random_html(rng: random.Random) -> str:
+    return "".join(rng.choice(_HTML_PIECES) for _ in range(rng.randint(0, 30)))
+
+
+def test_strip_script_style_matches_old_regex():
+    rng = random.Random(1)
+    for _ in range(3000):
+        s = _random_html(rng)
+        assert _strip_script_style(s) == _OLD_SCRIPT_STYLE.sub(" ", s), s
+
+
+def test_strip_tags_matches_old_regex():
+    rng = random.Random(2)
+    for _ in range(3000):
+        s = _random_html(rng)
+        assert _strip_tags(s) == _OLD_TAG.sub(" ", s), s
+
+
+def test_html_to_plain_text_matches_old_implementation():
+    rng = random.Random(3)
+    for _ in range(3000):
+        s = _random_html(rng)
+        max_len = rng.choice([5, 50, 400])
+        assert html_to_plain_text(s, max_len) == _old_html_to_plain_text(s, max_len), s
+
+
+def _cf_html(fragment: str, prefix: str = "<html><body><!--StartFragment-->") -> bytes:
+    body = fragment.encode("utf-8")
+    pre = prefix.encode("utf-8")
+    post = b"<!--EndFragment--></body></html>"
+    template = (
+        "Version:0.9\r\nStartHTML:{:010d}\r\nEndHTML:{:010d}\r\n"
+        "StartFragment:{:010d}\r\nEndFragment:{:010d}\r\n"
+    )
+    header_len = len(template.format(0, 0, 0, 0))
+    start = header_len + len(pre)
+    end = start + len(body)
+    header = template.format(header_len, end + len(post), start, end).encode("ascii")
+    return header + pre + body + post
+
+
+@pytest.mark.parametrize("fragment", ["", "<b>hi</b>", "中文 <i>text</i>", "x" * 5000])
+def test_extract_html_fragment_matches_old_parser(fragment):
+    raw = _cf_html(fragment)
+    assert extract_html_fragment(raw) == _old_extract_html_fragment(raw)
+    if fragment:
+        assert extract_html_fragment(raw) == fragment
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [b"", b"garbage", b"StartFragment:abc\r\nEndFragment:10\r\n", b"StartFragment:50\r\nEndFragment:10\r\n"],
+)
+def test_extract_html_fragment_rejects_bad_headers(raw):
+    assert extract_html_fragment(raw) == "" == _old_extract_html_fragment(raw)
+
+
+def test_extract_html_fragment_max_len_bounds_decoded_bytes():
+    raw = _cf_html("y" * 1000)
+    assert extract_html_fragment(raw, max_len=10) == "y" * 40
+
+
+def test_rtf_ctrl_ws_matches_old_two_pass_cleanup():
+    rng = random.Random(4)
+    pieces = ["\\par ", "\\b0", "\\fs20 ", "{", "}", "\\\\", "\\{", " ", "\n", "\t", "word", "\\'e9", "\\"]
+    for _ in range(3000):
+        s = "".join(rng.choice(pieces) for _ in range(rng.randint(0, 25)))
+        old = _OLD_WS.sub(" ", _OLD_RTF_CTRL.sub(" ", s)).strip()
+        assert _RE_RTF_CTRL_WS.sub(" ", s).strip() == old, s
+
+
+# Expected outputs recorded from the character-by-character RTF scanner that
+# the literal-run regex replaced.
+@pytest.mark.parametrize(
+    "raw, expected",
+    [
+        (
+            b"{\\rtf1\\ansi\\deff0{\\fonttbl{\\f0 Arial;}}{\\colortbl;\\red0\\green0\\blue0;}"
+            b"\\f0\\fs20 Hello, world!\\par Second line\\tab end.}",
+            "Hello, world!\nSecond line end.",
+        ),
+        (b"{\\rtf1\\ansi{\\*\\generator Riched20;}caf\\'e9 \\u8364? euro\\par}", "caf\u00e9 \u20ac euro"),
+        (b"{\\rtf1\\uc2 A\\u8364\\'80\\'80 B\\u-3913??C}", "A\u20ac B\uf0b7C"),
+        (b"{\\rtf1 braces \\{ and \\} and backslash \\\\ here\\line next}", "braces { and } and backslash \\ here\nnext"),
+        (b"{\\rtf1 before{\\pict\\pngblip 89504e470d0a1a0a0000}after}", "beforeafter"),
+        (b"{\\rtf1 nbsp\\~dash\\-under\\_end}", "nbsp dash-under-end"),
+        (b"{\\rtf1 line one\r\n\\par\r\n\r\n\\par\r\n\\par   spaced    out   \\par}", "line one\n\nspaced out"),
+        (b"{\\rtf1", "(RTF)"),
+        (b"", "(RTF)"),
+    ],
+)
+def test_rtf_to_plain_text(raw, expected):
+    assert rtf_to_plain_text(raw) == expected
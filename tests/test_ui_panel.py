@@ -0,0 +1,176 @@
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+pytest.importorskip("PySide6")
+
+from cliphist.models import ClipboardItem
+from cliphist.ui_panel import (
+    _BLOB_SCAN_MIN_ITEMS,
+    ROLE_PAYLOAD,
+    ClipPanel,
+    _build_row,
+    _build_search_blob,
+    _ClipListModel,
+    _extra_runs,
+    _scan_search_blob,
+)
+
+
+@pytest.fixture(autouse=True)
+def _qapp(qapp):
+    return qapp
+
+
+_T0 = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def _text_item(text: str, i: int = 0) -> ClipboardItem:
+    return ClipboardItem(created_at=_T0 + timedelta(seconds=i), item_type="text", text=text)
+
+
+def _random_text(rng: random.Random) -> str:
+    words = ["alpha", "beta", "gamma", "delta", "Hello", "world", "foo", "bar", "a", "ab", "ba"]
+    return " ".join(rng.choice(words) for _ in range(rng.randint(1, 5)))
+
+
+# --- _extra_runs / _ClipListModel.set_items ---------------------------------
+
+
+def _naive_extra_runs(short: list, long: list) -> list[tuple[int, int]] | None:
+    j = 0
+    extra: list[int] = []
+    for i, x in enumerate(long):
+        if j < len(short) and x is short[j]:
+            j += 1
+        else:
+            extra.append(i)
+    if j != len(short):
+        return None
+    runs: list[tuple[int, int]] = []
+    for i in extra:
+        if runs and runs[-1][1] == i - 1:
+            runs[-1] = (runs[-1][0], i)
+        else:
+            runs.append((i, i))
+    return runs
+
+
+def test_extra_runs_matches_naive():
+    rng = random.Random(1)
+    pool = [object() for _ in range(30)]
+    for _ in range(500):
+        long = rng.sample(pool, rng.randint(0, len(pool)))
+        if rng.random() < 0.8:
+            short = [x for x in long if rng.random() < 0.6]
+        else:
+            short = rng.sample(pool, rng.randint(0, 10))
+        assert _extra_runs(short, long) == _naive_extra_runs(short, long)
+
+
+def _model_rows(model: _ClipListModel) -> list[tuple]:
+    return [model.index(r, 0).data(ROLE_PAYLOAD) for r in range(model.rowCount())]
+
+
+def test_set_items_diffs_produce_the_target_rows():
+    rng = random.Random(2)
+    pool = [_text_item(_random_text(rng), i) for i in range(60)]
+    rows = {id(it): _build_row(it)[0] for it in pool}
+    model = _ClipListModel()
+    # Replays the row signals on a shadow list, as a view would, to check that
+    # the incremental inserts/removals describe the change correctly.
+    shadow: list[tuple] = []
+
+    def on_inserted(parent, first, last):
+        shadow[first:first] = _model_rows(model)[first : last + 1]
+
+    def on_removed(parent, first, last):
+        del shadow[first : last + 1]
+
+    def on_reset():
+        shadow[:] = _model_rows(model)
+
+    def on_changed(top_left, bottom_right, roles=()):
+        shadow[top_left.row() : bottom_right.row() + 1] = _model_rows(model)[top_left.row() : bottom_right.row() + 1]
+
+    model.rowsInserted.connect(on_inserted)
+    model.rowsRemoved.connect(on_removed)
+    model.modelReset.connect(on_reset)
+    model.dataChanged.connect(on_changed)
+
+    current: list[ClipboardItem] = []
+    for step in range(300):
+        kind = rng.random()
+        if kind < 0.35 and current:
+            items = [it for it in current if rng.random() < 0.7]
+        elif kind < 0.7:
+            extra = set(map(id, rng.sample(pool, rng.randint(0, 20))))
+            keep = set(map(id, current))
+            items = [it for it in pool if id(it) in keep or id(it) in extra]
+        else:
+            items = rng.sample(pool, rng.randint(0, len(pool)))
+        fav_ids = [("fav" if rng.random() < 0.2 else None) for _ in items]
+        row_models = [rows[id(it)] for it in items]
+
+        model.set_items(items, fav_ids, row_models)
+
+        assert model.rowCount() == len(items)
+        got = _model_rows(model)
+        expected = list(zip(items, fav_ids, row_models))
+        assert len(got) == len(expected)
+        for view in (got, shadow):
+            assert len(view) == len(expected), step
+            for (g_it, g_fav, g_row), (e_it, e_fav, e_row) in zip(view, expected):
+                assert g_it is e_it and g_fav == e_fav and g_row == e_row, step
+        current = items
+
+
+def test_set_items_narrowing_does_not_reset():
+    items = [_text_item(f"row {i}", i) for i in range(10)]
+    rows = [_build_row(it)[0] for it in items]
+    model = _ClipListModel()
+    model.set_items(items, [None] * 10, rows)
+    resets = []
+    removed = []
+    model.modelReset.connect(lambda: resets.append(1))
+    model.rowsRemoved.connect(lambda parent, a, b: removed.append((a, b)))
+
+    keep = [0, 1, 4, 5, 9]
+    model.set_items([items[i] for i in keep], [None] * len(keep), [rows[i] for i in keep])
+
+    assert resets == []
+    assert sorted(removed) == [(2, 3), (6, 8)]
+
+
+# --- search --------------------------------------------------------------------
+
+
+def test_scan_search_blob_matches_naive_filter():
+    rng = random.Random(3)
+    for _ in range(300):
+        index = ["".join(rng.choice("ab \n") for _ in range(rng.randint(0, 8))) for _ in range(rng.randint(1, 40))]
+        q = "".join(rng.choice("ab ") for _ in range(rng.randint(1, 3)))
+        blob, starts = _build_search_blob(index)
+        assert _scan_search_blob(blob, starts, q) == [i for i, hay in enumerate(index) if q in hay]
+
+
+def _naive_search(items: list[ClipboardItem], query: str) -> list[ClipboardItem]:
+    terms = query.strip().lower().split()
+    return [it for it in items if all(t in _build_row(it)[1] for t in terms)]
+
+
+@pytest.mark.parametrize("count", [50, _BLOB_SCAN_MIN_ITEMS + 50])
+def test_history_filter_matches_naive_multi_term_filter(count):
+    rng = random.Random(count)
+    items = [_text_item(_random_text(rng), i) for i in range(count)]
+    items.append(ClipboardItem(created_at=_T0, item_type="files", file_paths=("C:\\Data\\Report.txt",)))
+    panel = ClipPanel(on_activate=lambda it: None)
+    panel.set_items(items)
+
+    for query in ["", "hello", "WORLD foo", "a b", "ab ba", "report", "data report", "alpha beta gamma", "zzz"]:
+        panel._search.setText(query)
+        panel._apply_filter()
+        expected = _naive_search(items, query)
+        assert [id(it) for it in panel._filtered_items] == [id(it) for it in expected], query
+        assert panel._model_all.rowCount() == len(expected)